@@ -5,8 +5,13 @@ import logging
 import time
 import shutil
 import tempfile
+import functools
+import collections
+from itertools import islice
 from typing import List, Optional, Tuple, Dict, Any, Union # Added Union
 from dataclasses import dataclass, field
+from pathlib import PurePosixPath
+from enum import IntEnum
 import math
 
 # --- Check and Handle NumPy Requirement FIRST ---
@@ -79,12 +84,14 @@ except ImportError:
 try:
     from PyQt5 import QtWidgets, QtGui, QtCore
     from PyQt5.QtWidgets import (QApplication, QMainWindow, QFileDialog, QVBoxLayout,
-                                 QHBoxLayout, QLabel, QListWidget, QPushButton,
+                                 QHBoxLayout, QLabel, QListView, QPushButton,
                                  QLineEdit, QWidget, QMessageBox, QStyleFactory,
-                                 QListWidgetItem, QStatusBar, QAbstractItemView,
+                                 QStatusBar, QAbstractItemView,
                                  QCheckBox, QSlider, QComboBox, QFrame, QStyle,
                                  QProgressDialog) # Added QProgressDialog (Optional)
-    from PyQt5.QtCore import QSettings, Qt, QEvent, QTimer, QSize, QThread, pyqtSignal, QObject # Added QThread, pyqtSignal, QObject
+    from PyQt5.QtGui import QStandardItemModel, QStandardItem
+    from PyQt5.QtCore import QSettings, Qt, QEvent, QTimer, QSize, QThread, pyqtSignal, QObject, QRunnable, QThreadPool, QSignalBlocker # Added QThread, pyqtSignal, QObject
+    from PyQt5.QtCore import QSortFilterProxyModel, QModelIndex, QStringListModel, QItemSelectionModel
     _pyqt5_installed = True
 except ImportError:
      print("ERRORE CRITICO: Libreria 'PyQt5' non trovata. Installala con 'pip install PyQt5'")
@@ -102,10 +109,37 @@ SETTINGS_RECENT_FOLDERS = "folders/recentSubfolders"
 SETTINGS_LAST_VOLUME = "audio/lastVolume"
 SETTINGS_TARGET_LUFS = "audio/targetLUFS"
 MAX_RECENT_FOLDERS = 20
+RECENT_FOLDERS_PLACEHOLDER = "--- Seleziona Recente ---" # Row 0 of the recent folders combo
+# VLC states with media loaded (hot-path membership test: built once, not a new list per call)
+_PLAYING_STATES = frozenset((vlc.State.Playing, vlc.State.Paused)) if _vlc_installed else frozenset()
 TARGET_LUFS_DEFAULT = -14.0
 FULL_PATH_ROLE = Qt.UserRole + 1
+PLAYING_ROLE = Qt.UserRole + 2 # Flag on the list item marked as 'in play' (bold)
+FILTER_ROLE = Qt.UserRole + 3 # Text matched by the filter proxy (file name)
 STATUS_BAR_TIMEOUT = 4000
-PROGRESS_TIMER_INTERVAL = 250
+PROGRESS_SLIDER_MAX = 1000 # Slider range 0-1000 maps playback position 0.0-1.0
+PROGRESS_SLIDER_BUCKETS = 250 # Slider is only moved when the position crosses a bucket (step of 4 on 0-1000)
+
+class StatusKind(IntEnum):
+    """Tipo del messaggio in status bar (evita di interpretare il testo per decidere cosa fare)."""
+    IDLE = 0
+    PLAY_ORIG = 1
+    PREVIEW = 2
+    PAUSE_ORIG = 3
+    PAUSE_PREVIEW = 4
+
+PLAYER_STATUS_KINDS = (StatusKind.PLAY_ORIG, StatusKind.PREVIEW, StatusKind.PAUSE_ORIG, StatusKind.PAUSE_PREVIEW)
+
+# Confirmation text for Normalizza/Sposta (rich text, filled with str.format at each request)
+_CONFIRM_TMPL = (
+    "<b>Confermi l'operazione?</b><br><br>"
+    "<b>File:</b> '{display_name}'<br>"
+    "<b>Azione:</b> Normalizza a <b>{target_lufs:.1f} LUFS</b> e Salva come WAV<br>"
+    "<b>Destinazione:</b> ...{sep}{base_name}{sep}<b>{relative}</b><br>"
+    "<b>Nuovo Nome File:</b> '{wav_name}'<br>"
+    "{original_lufs}<br><br>"
+    "<font color='orange'><b>ATTENZIONE:</b> Il file MP3 originale ('{source_name}') sarà <b>eliminato definitivamente</b> se l'operazione riesce.</font>"
+)
 
 # --- Logging Setup ---
 log_formatter = logging.Formatter('%(asctime)s [%(threadName)s:%(levelname)s] %(message)s') # Added threadName
@@ -150,6 +184,7 @@ class MusicFileData:
 
 
 # --- Helper Function ---
+@functools.lru_cache(maxsize=4096) # Many files share the same durations; cache the formatted string
 def format_time(milliseconds: Optional[int]) -> str:
     if milliseconds is None or milliseconds <= 0: return "00:00"
     seconds_total = round(milliseconds / 1000)
@@ -157,6 +192,12 @@ def format_time(milliseconds: Optional[int]) -> str:
     secs = seconds_total % 60
     return f"{mins:02d}:{secs:02d}"
 
+def _set_enabled(widget: 'QWidget', enabled: bool) -> None:
+    """setEnabled solo se cambia: lo stato 'esplicito' è letto da WA_ForceDisabled (resta coerente anche con setEnabled diretti)."""
+    enabled = bool(enabled)
+    if widget.testAttribute(Qt.WA_ForceDisabled) == enabled:
+        widget.setEnabled(enabled)
+
 # --- File Management & Normalization ---
 class FileManager:
     """Gestisce caricamento file, metadati (durata), normalizzazione (WAV), spostamento."""
@@ -494,6 +535,7 @@ class MusicPlayer:
         self.player: Optional[vlc.MediaPlayer] = None
         self._com_initialized_here = False
         self.vlc_error: Optional[str] = None
+        self._attached_events: List[Any] = [] # vlc.EventType attached via attach_event (detached on release)
         self._lock = QObject() # For potential future finer-grained locking if needed
 
         if not _vlc_installed:
@@ -554,6 +596,21 @@ class MusicPlayer:
     def get_init_error(self) -> Optional[str]:
         return self.vlc_error
 
+    def attach_event(self, event_type: Any, callback: callable) -> bool:
+        """Registra una callback per un evento del media player VLC.
+           ATTENZIONE: la callback viene eseguita nel thread interno di VLC, non nel thread GUI."""
+        if not self.is_ready():
+            logging.warning(f"Attach evento VLC ignorato ({event_type}): Player non pronto.")
+            return False
+        try:
+            self.player.event_manager().event_attach(event_type, callback)
+            self._attached_events.append(event_type)
+            logging.debug(f"Evento VLC collegato: {event_type}")
+            return True
+        except Exception as e:
+            logging.error(f"Impossibile collegare evento VLC {event_type}: {e}", exc_info=True)
+            return False
+
     def play(self, file_path: str) -> bool:
         if not self.is_ready():
             logging.error("Play fallito: Player non inizializzato correttamente.")
@@ -619,7 +676,7 @@ class MusicPlayer:
             logging.debug(f"Chiamo player.pause(). Stato attuale: {self.get_state()}")
             self.player.pause()
             # State change might be slightly delayed
-            QTimer.singleShot(50, lambda: logging.info(f"Pausa/Riprendi eseguito. Nuovo stato (atteso): {self.get_state()}"))
+            QTimer.singleShot(50, Qt.CoarseTimer, lambda: logging.info(f"Pausa/Riprendi eseguito. Nuovo stato (atteso): {self.get_state()}"))
         else:
             logging.warning("Pause ignorato: Player non pronto.")
 
@@ -631,7 +688,7 @@ class MusicPlayer:
                   self.player.stop()
                   # Allow VLC time to process stop, especially important before release()
                   # Checking state immediately might still show Playing
-                  QTimer.singleShot(50, lambda: logging.info(f"Riproduzione fermata. Nuovo stato (atteso): {self.get_state()}"))
+                  QTimer.singleShot(50, Qt.CoarseTimer, lambda: logging.info(f"Riproduzione fermata. Nuovo stato (atteso): {self.get_state()}"))
              else:
                  logging.debug("Stop ignorato: Player già fermo.")
          elif not self.is_ready():
@@ -692,6 +749,15 @@ class MusicPlayer:
             if self.player:
                 player_instance = self.player
                 self.player = None # Prevent further calls
+                # Detach event callbacks first so no VLC thread callback fires during shutdown
+                if self._attached_events:
+                    try:
+                        event_manager = player_instance.event_manager()
+                        for event_type in self._attached_events:
+                            event_manager.event_detach(event_type)
+                    except Exception as detach_e:
+                        logging.warning(f"Errore distacco eventi VLC (ignoro): {detach_e}")
+                    self._attached_events = []
                 if player_instance.is_playing(): # Check using the instance we captured
                     logging.debug("Fermo il player prima del rilascio.")
                     player_instance.stop()
@@ -745,11 +811,11 @@ QPushButton:disabled { background-color: #566573; color: #95a5a6; border: 1px so
 QPushButton#PreviewButton { /* No change needed if toggle works */ }
 QPushButton#PreviewButton:checked { background-color: #e67e22; border: 1px solid #d35400; color: white; } /* Orange when active */
 QPushButton#PreviewButton:checked:hover { background-color: #f39c12; }
-QListWidget { background-color: #34495e; border: 1px solid #566573; border-radius: 3px; alternate-background-color: #3a5064; outline: 0; color: #ecf0f1; }
-QListWidget::item { padding: 5px 3px; border-bottom: 1px solid #405060; } /* Add subtle line between items */
-QListWidget::item:alternate { background-color: #3a5064; }
-QListWidget::item:selected { background-color: #3498db; color: white; border: none; }
-QListWidget::item:disabled { color: #7f8c8d; background-color: #304050; } /* Style for disabled items if needed */
+QListView#MusicListView { background-color: #34495e; border: 1px solid #566573; border-radius: 3px; alternate-background-color: #3a5064; outline: 0; color: #ecf0f1; }
+QListView#MusicListView::item { padding: 5px 3px; border-bottom: 1px solid #405060; } /* Add subtle line between items */
+QListView#MusicListView::item:alternate { background-color: #3a5064; }
+QListView#MusicListView::item:selected { background-color: #3498db; color: white; border: none; }
+QListView#MusicListView::item:disabled { color: #7f8c8d; background-color: #304050; } /* Style for disabled items if needed */
 QComboBox { background-color: #34495e; border: 1px solid #566573; border-radius: 3px; padding: 4px 18px 4px 5px; min-width: 6em; color: #ecf0f1; }
 QComboBox:!editable { background: #34495e; }
 QComboBox:on { /* shift the text when the popup opens */ padding-top: 4px; padding-left: 5px; background-color: #4a6175; border: 1px solid #3498db; }
@@ -971,12 +1037,120 @@ class NormalizeWorker(QObject):
              logging.debug(f"{self.objectName()} run() terminato.")
 
 
+class FileDeleteRunnable(QRunnable):
+    """Elimina un file nel thread pool globale (evita di bloccare la UI su dischi temp lenti)."""
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+
+    def run(self):
+        try:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+                logging.info(f"File anteprima temporaneo eliminato: {self.path}")
+            else:
+                # If path variable exists but file doesn't, log as debug
+                logging.debug(f"Pulizia anteprima: Percorso '{self.path}' non trovato su disco.")
+        except OSError as e:
+            logging.warning(f"Impossibile eliminare il file anteprima '{self.path}': {e}")
+        except Exception as e:
+            logging.error(f"Errore imprevisto eliminazione file anteprima '{self.path}': {e}", exc_info=True)
+
+
+class PathValidateSignals(QObject):
+    """Segnali del PathValidateRunnable (uno per istanza: i QRunnable non sono QObject)."""
+    finished = pyqtSignal(object) # Emits PathValidateRunnable.ValidationResult
+
+
+class PathValidateRunnable(QRunnable):
+    """Controlla la destinazione dello spostamento nel thread pool (exists/isdir possono bloccare su share di rete)."""
+
+    @dataclass
+    class ValidationResult:
+        source_path: str
+        cleaned_relative: str
+        base_dir_ok: bool = False
+        destination_folder: Optional[str] = None
+        destination_file_path_wav: Optional[str] = None
+        destination_exists: bool = False
+        error: Optional[str] = None
+
+    def __init__(self, base_dir: str, cleaned_relative: str, source_path: str):
+        super().__init__()
+        self.base_dir = base_dir
+        self.cleaned_relative = cleaned_relative
+        self.source_path = source_path
+        self.signals = PathValidateSignals()
+
+    @staticmethod
+    def clean_relative_subfolder(relative_subfolder: str) -> str:
+        """Pulisce il percorso relativo (solo stringhe, nessun I/O: sicuro sul thread UI). Solleva ValueError se non valido."""
+        # Replace backslashes, remove leading/trailing slashes; PurePosixPath drops '.' and duplicate '/'
+        p = PurePosixPath(relative_subfolder.replace("\\", "/").strip("/"))
+        # Basic sanity checks
+        if not p.parts or p.is_absolute() or ".." in p.parts or ":" in p.parts[0]: # ':' -> Windows drive (C:)
+             raise ValueError("Percorso relativo non valido o non sicuro.")
+        cleaned_relative = str(p) # Always '/'-separated, joined to the base with os.path.join(*parts)
+        # Check for invalid characters (basic check, OS specific might be needed)
+        # invalid_chars = '<>:"/\\|?*' # Example, might vary by OS
+        # if any(c in invalid_chars for c in cleaned_relative):
+        #      raise ValueError("Il nome della sottocartella contiene caratteri non validi.")
+        return cleaned_relative
+
+    @staticmethod
+    def validate_destination(base: str, relative: str, source_path: str) -> 'PathValidateRunnable.ValidationResult':
+        """Costruisce il percorso WAV di destinazione e verifica su disco (I/O: da chiamare fuori dal thread UI)."""
+        result = PathValidateRunnable.ValidationResult(source_path=source_path, cleaned_relative=relative)
+        try:
+            result.base_dir_ok = os.path.isdir(base)
+            if not result.base_dir_ok:
+                return result
+            result.destination_folder = os.path.join(base, *PurePosixPath(relative).parts)
+            source_basename = os.path.basename(source_path)
+            destination_filename_wav = f"{os.path.splitext(source_basename)[0]}.wav"
+            result.destination_file_path_wav = os.path.join(result.destination_folder, destination_filename_wav)
+            result.destination_exists = os.path.exists(result.destination_file_path_wav)
+        except Exception as e: # Catch other unexpected errors during path join/validation
+            result.error = str(e)
+        return result
+
+    def run(self):
+        result = self.validate_destination(self.base_dir, self.cleaned_relative, self.source_path)
+        self.signals.finished.emit(result)
+
 
 # --- Main Application Window ---
 class MainWindow(QMainWindow):
     """Finestra principale (ora con gestione multithreading)."""
     # Define signals this window might emit if needed elsewhere (optional)
     # library_updated = pyqtSignal()
+    # VLC event callbacks run on libvlc's thread: they only append to _vlc_event_q and emit this
+    # signal (queued), the GUI thread drains the queue in _drain_vlc_events
+    vlc_event_wake = pyqtSignal()
+
+    # Precomputed tooltips for _update_button_states, keyed on the reason a control is enabled/disabled
+    _PLAY_TOOLTIPS = {
+        "ok": "Riproduci il file MP3 originale selezionato (Spazio)",
+        "no_sel": "Seleziona un brano per riprodurlo",
+    }
+    _TT_PREVIEW_OK = "Genera e ascolta un'anteprima normalizzata (Ctrl+P)"
+    # Composed once at class creation; _do_update_button_states only selects a key
+    _PREVIEW_TOOLTIPS = {
+        "ok": _TT_PREVIEW_OK,
+        "no_lib": _TT_PREVIEW_OK + "\n(Disabilitato: Librerie audio mancanti)",
+        "no_sel": _TT_PREVIEW_OK + "\n(Disabilitato: Seleziona un brano)",
+        "busy_orig": _TT_PREVIEW_OK + "\n(Disabilitato durante riproduzione originale)",
+        "playing": "Ferma l'anteprima in corso (Ctrl+P)",
+    }
+    _MOVE_TOOLTIPS = {
+        "ok": "Normalizza, salva WAV in sottocartella, elimina MP3 originale.",
+        "no_lib": "Spostamento disabilitato: Librerie normalizzazione mancanti o errore init.",
+        "no_sel": "Spostamento disabilitato: Seleziona un file.",
+        "no_output": "Spostamento disabilitato: Seleziona una Cartella Base Output valida.",
+        "no_subfolder": "Spostamento disabilitato: Specifica una Sottocartella di destinazione.",
+        "preview": "Spostamento disabilitato durante l'anteprima.",
+    }
 
     def __init__(self):
         super().__init__()
@@ -1002,6 +1176,7 @@ class MainWindow(QMainWindow):
                            f"Dettaglio errore: {error_msg}")
             self._show_critical_error("Errore Inizializzazione Player VLC", detailed_text)
             sys.exit(1) # Exit if player is critical and failed
+        self._player_ready: bool = True # Cached readiness, cleared when the player is released in closeEvent
 
         # LUFS Meter (created once, passed to workers)
         self.lufs_meter: Optional[pyln.Meter] = None
@@ -1022,27 +1197,57 @@ class MainWindow(QMainWindow):
 
         # Internal State
         self.current_input_dir: Optional[str] = None
+        # Cached validity of the paths and subfolder field: set where they change, read by _update_button_states (no isdir per refresh)
+        self._input_dir_valid: bool = False
+        self._output_dir_valid: bool = False
+        self._subfolder_nonempty: bool = False
+        self._filter_in_progress: bool = False # currentChanged ignored while the proxy re-filters
+        self._last_tooltip_keys: Dict[QWidget, str] = {} # Widget -> key of the tooltip last set by _set_tooltip_by_key
+        self._saved_setting_values: Dict[str, Any] = {} # Settings key -> value last loaded/written (see _set_setting_if_changed)
         self.current_base_output_dir: Optional[str] = None
-        self.loaded_music_data: List[MusicFileData] = [] # Master list of scanned data
-        self.list_item_map: Dict[str, QListWidgetItem] = {} # Map full_path -> QListWidgetItem
+        # Master store of scanned data: full_path -> MusicFileData (dict keeps scan order, O(1) lookup/removal)
+        self.loaded_music_data_by_path: Dict[str, MusicFileData] = {}
+        self.list_item_map: Dict[str, QStandardItem] = {} # Map full_path -> QStandardItem (source model)
         self.recent_folders: List[str] = []
-        self.currently_playing_item: Optional[QListWidgetItem] = None
+        self._has_recents: bool = False # bool(self.recent_folders), refreshed wherever the list changes
+        self.currently_playing_item: Optional[QStandardItem] = None
         self.current_playing_file_path: Optional[str] = None # Path actually being played (original or temp preview)
+        self._current_status_display_name: Optional[str] = None # Display name of the playing track, resolved once at play start
+        self._last_status_msg: str = "Pronto." # Mirror of status_message_label text (avoids QLabel.text() round-trips)
+        self._status_kind: StatusKind = StatusKind.IDLE # What the status message refers to (set by show_status_message)
         self.current_media_duration_ms: int = -1
         self.is_progress_slider_dragging: bool = False
+        self._pending_slider_value: Optional[int] = None # Latest progress update not yet applied (see _flush_progress)
+        self._pending_time_text: Optional[str] = None
+        self._slider_flush_pending: bool = False
+        self._last_slider_bucket: int = -1 # Last quantized slider position sent to the UI
+        self._last_time_text: Optional[str] = None # Last time label text sent to the UI
         self.is_preview_playing: bool = False
         self.current_preview_temp_path: Optional[str] = None # Path to the temporary preview WAV file
         self.original_file_for_preview: Optional[str] = None # Keep track of the original MP3 path for the active preview
         self.active_worker_thread: Optional[QThread] = None # Keep track of the running thread
         self.worker_object: Optional[QObject] = None # Keep track of the worker object
+        self._path_validate_signals: Optional[PathValidateSignals] = None # Pending destination check (thread pool)
+        self._pending_move_args: Optional[Dict[str, Any]] = None # Move waiting for the player to stop (see _move_stage2_after_stop)
+        self._confirm_box: Optional[QMessageBox] = None # Move confirmation dialog, created on first use
+        self._settings_flush_pending: bool = False # Recent folders write scheduled (see _flush_recent_settings)
+        self._in_stop_playback: bool = False # Reentrancy guard for _stop_playback
+        self._vlc_state = vlc.State.NothingSpecial # Last player state reported by VLC events (no get_state() round-trip)
+        self._vlc_event_q: collections.deque = collections.deque() # (event_type, payload) state events from libvlc's thread (unbounded: none may be dropped)
+        self._latest_vlc_time: Optional[int] = None # Latest MediaPlayerTimeChanged value, consumed by _drain_vlc_events
+        self._vlc_drain_pending: bool = False # vlc_event_wake already emitted, drain not run yet
 
         # Fonts
         self.default_font = self.font()
         self.playing_font = QtGui.QFont(self.default_font)
         self.playing_font.setBold(True)
+        # Pause/resume icons, resolved once (standardIcon does a style lookup on every call)
+        self._icon_pause = self.style().standardIcon(QStyle.SP_MediaPause)
+        self._icon_play = self.style().standardIcon(QStyle.SP_MediaPlay)
 
         self._init_ui()
         self._init_timers()
+        self._init_player_events()
         self._load_settings() # This loads paths, volume, LUFS target and might trigger initial scan
         self._update_button_states() # Initial state based on loaded settings
         self.statusBar().showMessage("Pronto.", STATUS_BAR_TIMEOUT)
@@ -1057,7 +1262,8 @@ class MainWindow(QMainWindow):
         self._set_busy(False) # Ensure UI is not busy initially
 
 
-    def _show_critical_error(self, title: str, message: str):
+    @staticmethod
+    def _show_critical_error(title: str, message: str):
         """Utility to show critical error message box even if main window fails."""
         # Ensure QApplication exists
         app = QApplication.instance()
@@ -1144,6 +1350,7 @@ class MainWindow(QMainWindow):
         self.filter_edit.setPlaceholderText("Cerca per nome file...")
         self.filter_edit.setToolTip("Digita per filtrare l'elenco dei brani")
         self.filter_edit.textChanged.connect(self._filter_music_list)
+        self.filter_edit.textChanged.connect(self._on_filter_text_changed)
         self.clear_filter_button = QPushButton("Pulisci")
         self.clear_filter_button.setToolTip("Rimuovi il filtro di ricerca")
         self.clear_filter_button.clicked.connect(lambda: self.filter_edit.clear())
@@ -1154,13 +1361,23 @@ class MainWindow(QMainWindow):
         list_filter_layout.addLayout(filter_layout)
 
         # Music List Widget
-        self.music_list_widget = QListWidget(self)
-        self.music_list_widget.setToolTip("Elenco dei file MP3 trovati. Doppio click per riprodurre l'originale.")
-        self.music_list_widget.setSelectionMode(QAbstractItemView.SingleSelection) # Only one selection at a time
-        self.music_list_widget.setAlternatingRowColors(True) # Improves readability
-        self.music_list_widget.currentItemChanged.connect(self._on_current_item_changed) # Update state on selection change
-        self.music_list_widget.itemDoubleClicked.connect(self._play_selected_music_from_item) # Play on double click
-        list_filter_layout.addWidget(self.music_list_widget, 1) # Allow list to stretch vertically
+        # Model/view: items live in _list_model, the view shows them through the filter proxy
+        self._list_model = QStandardItemModel(0, 1, self) # One fixed column: rows are only ever removed/appended (never clear())
+        self._list_proxy = QSortFilterProxyModel(self)
+        self._list_proxy.setSourceModel(self._list_model)
+        self._list_proxy.setFilterRole(FILTER_ROLE)
+        self._list_proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.music_list_view = QListView(self)
+        self.music_list_view.setObjectName("MusicListView") # QSS: don't style the QComboBox popup (also a QListView)
+        self.music_list_view.setModel(self._list_proxy)
+        self.music_list_view.setToolTip("Elenco dei file MP3 trovati. Doppio click per riprodurre l'originale.")
+        self.music_list_view.setSelectionMode(QAbstractItemView.SingleSelection) # Only one selection at a time
+        self.music_list_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.music_list_view.setAlternatingRowColors(True) # Improves readability
+        self.music_list_view.setUniformItemSizes(True) # All rows share one height: lets the view skip per-item size layout on bulk inserts
+        self.music_list_view.selectionModel().currentChanged.connect(self._on_current_index_changed) # Update state on selection change
+        self.music_list_view.doubleClicked.connect(self._on_list_double_clicked) # Play on double click
+        list_filter_layout.addWidget(self.music_list_view, 1) # Allow list to stretch vertically
 
         main_layout.addLayout(list_filter_layout, 1) # Allow this section to stretch
 
@@ -1180,7 +1397,9 @@ class MainWindow(QMainWindow):
         self.recent_folder_combo.setToolTip("Seleziona una sottocartella usata di recente")
         self.recent_folder_combo.setMaxCount(MAX_RECENT_FOLDERS + 5) # Limit dropdown size
         self.recent_folder_combo.setInsertPolicy(QComboBox.NoInsert) # Items are managed programmatically
-        self.recent_folder_combo.addItem("--- Seleziona Recente ---") # Placeholder
+        # String list model: a full repopulation is a single setStringList (one modelReset)
+        self._recent_model = QStringListModel([RECENT_FOLDERS_PLACEHOLDER], self) # Placeholder
+        self.recent_folder_combo.setModel(self._recent_model)
         self.recent_folder_combo.setCurrentIndex(0)
         self.recent_folder_combo.currentIndexChanged.connect(self._recent_folder_selected) # Update edit field when selected
         recent_folder_layout.addWidget(self.recent_folder_label)
@@ -1193,7 +1412,7 @@ class MainWindow(QMainWindow):
         self.subfolder_edit = QLineEdit()
         self.subfolder_edit.setPlaceholderText("es. House/Deep House o Techno/Peak Time")
         self.subfolder_edit.setToolTip("Inserisci il percorso relativo della sottocartella di destinazione (verrà creata se non esiste)")
-        self.subfolder_edit.textChanged.connect(self._update_button_states) # Enable/disable move button based on input
+        self.subfolder_edit.textChanged.connect(self._on_subfolder_text_changed) # Enable/disable move button based on input
         self.move_to_subfolder_button = QPushButton("📁 Normalizza e Sposta")
         self.move_to_subfolder_button.setToolTip("Normalizza il file selezionato al Target LUFS, lo salva come WAV nella sottocartella specificata e cancella l'MP3 originale")
         self.move_to_subfolder_button.clicked.connect(self._move_selected_to_subfolder)
@@ -1222,7 +1441,7 @@ class MainWindow(QMainWindow):
         self.current_time_label.setAlignment(Qt.AlignCenter)
         self.progress_slider = QSlider(Qt.Horizontal)
         self.progress_slider.setToolTip("Barra di avanzamento / Clicca o trascina per cercare")
-        self.progress_slider.setRange(0, 1000) # Use a fixed range (0-1000) for position (0.0-1.0)
+        self.progress_slider.setRange(0, PROGRESS_SLIDER_MAX) # Use a fixed range (0-1000) for position (0.0-1.0)
         self.progress_slider.setValue(0)
         # Connect slider signals for seeking
         self.progress_slider.sliderPressed.connect(self._progress_slider_pressed)
@@ -1247,7 +1466,7 @@ class MainWindow(QMainWindow):
         self.play_button.setToolTip("Riproduci il file MP3 originale selezionato (Spazio)")
         self.play_button.setShortcut(Qt.Key_Space) # Keyboard shortcut
         self.play_button.clicked.connect(self._play_selected_music)
-        self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
+        self.play_button.setIcon(self._icon_play)
         # Preview Button (Checkable)
         self.preview_button = QPushButton("🎧 Preview Norm.")
         self.preview_button.setToolTip("Genera e ascolta un'anteprima normalizzata (WAV temporaneo) (Ctrl+P)")
@@ -1261,7 +1480,7 @@ class MainWindow(QMainWindow):
         self.pause_button.setToolTip("Metti in pausa / Riprendi la riproduzione (P)")
         self.pause_button.setShortcut(Qt.Key_P) # Keyboard shortcut
         self.pause_button.clicked.connect(self._toggle_pause)
-        self.pause_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPause))
+        self.pause_button.setIcon(self._icon_pause)
         # Stop Button
         self.stop_button = QPushButton("■ Stop")
         self.stop_button.setToolTip("Ferma la riproduzione (S)")
@@ -1325,16 +1544,95 @@ class MainWindow(QMainWindow):
 
 
     def _init_timers(self):
-        """Inizializza QTimer per aggiornamento progresso UI (playback)."""
-        self.progress_timer = QTimer(self)
-        self.progress_timer.setInterval(PROGRESS_TIMER_INTERVAL) # Update ~4 times per second
-        self.progress_timer.timeout.connect(self._update_progress)
-        logging.debug("Timer Progresso UI inizializzato.")
-
+        """Inizializza QTimer della UI (il progresso playback è guidato dagli eventi VLC)."""
         # Timer for clearing status bar messages
         self.status_clear_timer = QTimer(self)
         self.status_clear_timer.setSingleShot(True)
-        self.status_clear_timer.timeout.connect(lambda: self.status_message_label.setText("Pronto."))
+        self.status_clear_timer.setTimerType(Qt.CoarseTimer) # Seconds-scale timeout, no need for a precise (high-resolution) timer
+        self.status_clear_timer.timeout.connect(self._clear_status_message)
+
+        # Coalescing timer for _update_button_states: a burst of requests runs one refresh on the next loop pass
+        self._ui_update_timer = QTimer(self)
+        self._ui_update_timer.setSingleShot(True)
+        self._ui_update_timer.setInterval(0)
+        self._ui_update_timer.timeout.connect(self._do_update_button_states)
+
+
+    def _init_player_events(self):
+        """Collega gli eventi VLC agli slot UI (sostituisce il polling con timer del progresso)."""
+        self.vlc_event_wake.connect(self._drain_vlc_events, Qt.QueuedConnection)
+        self.music_player.attach_event(vlc.EventType.MediaPlayerTimeChanged, self._on_vlc_time)
+        self.music_player.attach_event(vlc.EventType.MediaPlayerEndReached, self._on_vlc_end_reached)
+        self.music_player.attach_event(vlc.EventType.MediaPlayerEncounteredError, self._on_vlc_error)
+        self.music_player.attach_event(vlc.EventType.MediaPlayerStopped, self._on_vlc_stopped)
+        self.music_player.attach_event(vlc.EventType.MediaPlayerPlaying, self._on_vlc_playing)
+        self.music_player.attach_event(vlc.EventType.MediaPlayerPaused, self._on_vlc_paused)
+        logging.debug("Eventi VLC (TimeChanged/EndReached/EncounteredError/Stopped/Playing/Paused) collegati.")
+
+    # --- VLC Callbacks (VLC thread: only enqueue here, never touch widgets) ---
+    # deque.append is atomic in CPython: no lock is taken on libvlc's thread.
+    # State callbacks also store _vlc_state (single attribute assignment, read by the GUI thread)
+    def _wake_vlc_drain(self):
+        # One wake per event-loop pass: later events are picked up by the drain already scheduled
+        if not self._vlc_drain_pending:
+            self._vlc_drain_pending = True
+            self.vlc_event_wake.emit()
+
+    def _on_vlc_time(self, event):
+        # TimeChanged is not queued: only the latest value matters (bursts collapse to one UI update)
+        self._latest_vlc_time = event.u.new_time
+        self._wake_vlc_drain()
+
+    def _on_vlc_end_reached(self, event):
+        self._vlc_state = vlc.State.Ended
+        self._vlc_event_q.append((vlc.EventType.MediaPlayerEndReached, None))
+        self._wake_vlc_drain()
+
+    def _on_vlc_error(self, event):
+        self._vlc_state = vlc.State.Error
+        self._vlc_event_q.append((vlc.EventType.MediaPlayerEncounteredError, None))
+        self._wake_vlc_drain()
+
+    def _on_vlc_stopped(self, event):
+        self._vlc_state = vlc.State.Stopped
+        self._vlc_event_q.append((vlc.EventType.MediaPlayerStopped, None))
+        self._wake_vlc_drain()
+
+    def _on_vlc_playing(self, event):
+        self._vlc_state = vlc.State.Playing
+        self._vlc_event_q.append((vlc.EventType.MediaPlayerPlaying, None))
+        self._wake_vlc_drain()
+
+    def _on_vlc_paused(self, event):
+        self._vlc_state = vlc.State.Paused
+        self._vlc_event_q.append((vlc.EventType.MediaPlayerPaused, None))
+        self._wake_vlc_drain()
+
+    def _drain_vlc_events(self):
+        """Svuota la coda eventi VLC nel thread GUI. Per il tempo viene applicato solo l'ultimo valore ricevuto."""
+        self._vlc_drain_pending = False # Reset first: events arriving from now on schedule a new drain
+        latest_time = self._latest_vlc_time
+        self._latest_vlc_time = None
+        if latest_time is not None:
+            self._update_progress(latest_time) # One slider/label update per event-loop pass
+        # Take the queued events first: _on_playback_error opens a modal dialog whose nested
+        # event loop can run another drain, which must not share this loop's queue.
+        # popleft() per item (not list()+clear()) so an append from libvlc's thread is never lost.
+        events = []
+        while self._vlc_event_q:
+            events.append(self._vlc_event_q.popleft())
+        for event_type, payload in events:
+            if event_type == vlc.EventType.MediaPlayerEndReached:
+                self._on_playback_ended()
+            elif event_type == vlc.EventType.MediaPlayerEncounteredError:
+                self._on_playback_error()
+            elif event_type == vlc.EventType.MediaPlayerStopped:
+                self._continue_pending_move()
+                self._update_button_states()
+            elif event_type in (vlc.EventType.MediaPlayerPlaying, vlc.EventType.MediaPlayerPaused):
+                # Pause/Resume button text and enabled controls follow the reported state
+                self._update_ui_for_player_state()
+                self._update_button_states()
 
 
     # --- Thread Management & UI State ---
@@ -1349,7 +1647,7 @@ class MainWindow(QMainWindow):
             self.browse_input_button.setEnabled(False)
             self.browse_output_button.setEnabled(False)
             self.recursive_scan_checkbox.setEnabled(False)
-            self.music_list_widget.setEnabled(False) # Prevent selection changes
+            self.music_list_view.setEnabled(False) # Prevent selection changes
             self.filter_edit.setEnabled(False)
             self.clear_filter_button.setEnabled(False)
             self.recent_folder_combo.setEnabled(False)
@@ -1358,16 +1656,19 @@ class MainWindow(QMainWindow):
             self.play_button.setEnabled(False)
             self.preview_button.setEnabled(False) # Disable starting new preview
             # Keep playback controls enabled if something is ALREADY playing
-            is_playing = self.music_player.get_state() in [vlc.State.Playing, vlc.State.Paused]
+            is_playing = self._vlc_state in _PLAYING_STATES
             self.pause_button.setEnabled(is_playing)
             self.stop_button.setEnabled(is_playing)
             self.progress_slider.setEnabled(is_playing)
             self.setCursor(Qt.WaitCursor)
         else:
             self.unsetCursor()
-            self.music_list_widget.setEnabled(True) # Re-enable list first
+            self.music_list_view.setEnabled(True) # Re-enable list first
+            # These follow their own signals/flags, not _update_button_states
+            self.clear_filter_button.setEnabled(bool(self.filter_edit.text()))
+            self.subfolder_edit.setEnabled(self._output_dir_valid)
             self._update_button_states() # Re-enable controls based on current state
-            if self.status_message_label.text() == message or message == "Operazione in corso...":
+            if self._last_status_msg == message or message == "Operazione in corso...":
                  # If the persistent message is still shown, clear it after a delay
                  self.show_status_message("Pronto.", timeout=STATUS_BAR_TIMEOUT)
 
@@ -1469,14 +1770,23 @@ class MainWindow(QMainWindow):
 
     # --- UI Actions & Handlers ---
 
-    def show_status_message(self, message: str, timeout: int = STATUS_BAR_TIMEOUT, persistent: bool = False):
+    def show_status_message(self, message: str, timeout: int = STATUS_BAR_TIMEOUT, persistent: bool = False,
+                            kind: StatusKind = StatusKind.IDLE):
         """Mostra messaggio nella status bar, con opzione timeout o persistente."""
+        self._last_status_msg = message
+        self._status_kind = kind
         self.status_message_label.setText(message)
         if self.status_clear_timer.isActive():
              self.status_clear_timer.stop() # Stop previous timer if any
         if not persistent and timeout > 0:
              self.status_clear_timer.start(timeout)
 
+    def _clear_status_message(self):
+        """Ripristina 'Pronto.' nella status bar allo scadere del timeout."""
+        self._last_status_msg = "Pronto."
+        self._status_kind = StatusKind.IDLE
+        self.status_message_label.setText("Pronto.")
+
     def _set_playback_controls_enabled(self, enabled: bool):
          """Abilita/disabilita controlli relativi alla riproduzione ATTIVA."""
          # Always respect the global busy state
@@ -1493,10 +1803,11 @@ class MainWindow(QMainWindow):
                  self.current_time_label.setText("00:00")
                  self.total_time_label.setText("00:00")
              self.current_media_duration_ms = -1 # Always reset duration info
+             self._reset_progress_cache()
              # Reset pause button appearance
              self.pause_button.setText("❚❚ Pausa")
              self.pause_button.setToolTip("Metti in pausa / Riprendi la riproduzione (P)")
-             self.pause_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPause))
+             self.pause_button.setIcon(self._icon_pause)
 
     def _browse_input_folder(self):
         """Apre dialog per selezionare cartella input."""
@@ -1508,6 +1819,7 @@ class MainWindow(QMainWindow):
             if normalized_dir != self.current_input_dir:
                 logging.info(f"Nuova Cartella Input selezionata: {normalized_dir}")
                 self.current_input_dir = normalized_dir
+                self._input_dir_valid = True # Returned by getExistingDirectory
                 self.folder_input_edit.setText(self.current_input_dir)
                 self.settings.setValue(SETTINGS_INPUT_PATH, self.current_input_dir)
                 self.show_status_message(f"Cartella Input impostata: {os.path.basename(self.current_input_dir)}", timeout=STATUS_BAR_TIMEOUT)
@@ -1525,6 +1837,7 @@ class MainWindow(QMainWindow):
             if normalized_dir != self.current_base_output_dir:
                 logging.info(f"Nuova Cartella Base Output selezionata: {normalized_dir}")
                 self.current_base_output_dir = normalized_dir
+                self._set_output_dir_valid(True) # Returned by getExistingDirectory
                 self.folder_output_edit.setText(self.current_base_output_dir)
                 self.settings.setValue(SETTINGS_OUTPUT_PATH, self.current_base_output_dir)
                 self.show_status_message(f"Cartella Output Base impostata: {os.path.basename(self.current_base_output_dir)}", timeout=STATUS_BAR_TIMEOUT)
@@ -1532,6 +1845,20 @@ class MainWindow(QMainWindow):
             else:
                 logging.debug("Cartella output selezionata è la stessa già impostata.")
 
+    def _set_output_dir_valid(self, valid: bool):
+        """Aggiorna il flag 'cartella output valida' e i controlli che dipendono solo da esso."""
+        self._output_dir_valid = valid
+        _set_enabled(self.subfolder_edit, valid)
+
+    def _on_filter_text_changed(self, text: str):
+        """Abilita 'Pulisci' solo se c'è un filtro (aggiornato solo al cambio del testo)."""
+        _set_enabled(self.clear_filter_button, bool(text))
+
+    def _on_subfolder_text_changed(self, text: str):
+        """Aggiorna il flag 'sottocartella specificata' e lo stato dei bottoni."""
+        self._subfolder_nonempty = bool(text.strip())
+        self._update_button_states()
+
     def _trigger_reload_music_list(self):
         """Ricarica lista file (es. cambio ricorsività), se non occupato."""
         if self.active_worker_thread and self.active_worker_thread.isRunning():
@@ -1558,9 +1885,9 @@ class MainWindow(QMainWindow):
 
         # Stop playback before reloading list
         self._stop_playback()
-        # Clear current list immediately
-        self.music_list_widget.clear()
-        self.loaded_music_data = []
+        # Clear current list immediately (removeRows keeps the column, so later appends go through the proxy filter)
+        self._list_model.removeRows(0, self._list_model.rowCount())
+        self.loaded_music_data_by_path = {}
         self.list_item_map = {}
         self._reset_playing_indicator()
         self._update_button_states() # Reflect empty list state
@@ -1571,6 +1898,7 @@ class MainWindow(QMainWindow):
         if not os.path.isdir(self.current_input_dir):
              QMessageBox.warning(self, "Errore Percorso Input", f"La cartella Input specificata non è valida o non accessibile:\n{self.current_input_dir}")
              self.current_input_dir = None
+             self._input_dir_valid = False
              self.folder_input_edit.clear()
              self.settings.remove(SETTINGS_INPUT_PATH)
              self.show_status_message("Percorso input invalido rimosso.", timeout=STATUS_BAR_TIMEOUT)
@@ -1588,27 +1916,37 @@ class MainWindow(QMainWindow):
     def _on_scan_finished(self, music_data_list: List[MusicFileData]):
         """Slot chiamato quando FileScannerWorker ha finito con successo."""
         logging.info(f"Scansione completata, ricevuti {len(music_data_list)} elementi.")
-        self.loaded_music_data = music_data_list
+        self.loaded_music_data_by_path = {fd.full_path: fd for fd in music_data_list}
 
-        if not self.loaded_music_data:
+        if not self.loaded_music_data_by_path:
             self.show_status_message("Nessun file MP3 valido trovato nella cartella.", timeout=STATUS_BAR_TIMEOUT * 2)
         else:
             # Populate the list widget (in main thread)
-            self.music_list_widget.setUpdatesEnabled(False) # Optimize adding many items
+            # Invariants hoisted out of the loop: show relative position only for recursive scans
+            show_relative_dir = bool(self.current_input_dir) and self.recursive_scan_checkbox.isChecked()
+            relative_dir_cache: Dict[str, str] = {} # dirname -> formatted relative dir (many files share a folder)
+            self.music_list_view.setUpdatesEnabled(False) # Optimize adding many items
             try:
                 self.list_item_map.clear() # Clear old map
-                for file_data in self.loaded_music_data:
-                    item = QListWidgetItem(file_data.display_name)
-                    item.setData(FULL_PATH_ROLE, file_data.full_path)
+                self._list_model.removeRows(0, self._list_model.rowCount())
+                for file_data in self.loaded_music_data_by_path.values():
+                    item = QStandardItem(file_data.display_name)
+                    item.setEditable(False)
+                    item.setData(file_data.full_path, FULL_PATH_ROLE)
+                    item.setData(file_data.filename, FILTER_ROLE)
                     # Create tooltip
                     tooltip_parts = []
                     duration_str = format_time(file_data.duration_ms) if file_data.duration_ms > 0 else "N/D"
                     tooltip_parts.append(f"Durata: {duration_str}")
                     # Add relative path info for context if recursive scan
                     try:
-                        if self.current_input_dir and self.recursive_scan_checkbox.isChecked():
-                            relative_dir = os.path.relpath(os.path.dirname(file_data.full_path), self.current_input_dir)
-                            relative_dir = "" if relative_dir == '.' else f"...{os.sep}{relative_dir}{os.sep}"
+                        if show_relative_dir:
+                            file_dir = os.path.dirname(file_data.full_path)
+                            relative_dir = relative_dir_cache.get(file_dir)
+                            if relative_dir is None:
+                                relative_dir = os.path.relpath(file_dir, self.current_input_dir)
+                                relative_dir = "" if relative_dir == '.' else f"...{os.sep}{relative_dir}{os.sep}"
+                                relative_dir_cache[file_dir] = relative_dir
                             tooltip_parts.append(f"Posizione: {relative_dir}{file_data.filename}")
                         else:
                              tooltip_parts.append(f"File: {file_data.filename}")
@@ -1617,12 +1955,12 @@ class MainWindow(QMainWindow):
 
                     item.setToolTip("\n".join(tooltip_parts))
                     item.setFont(self.default_font) # Ensure default font initially
-                    self.music_list_widget.addItem(item)
+                    self._list_model.appendRow(item)
                     self.list_item_map[file_data.full_path] = item # Update map
             finally:
-                self.music_list_widget.setUpdatesEnabled(True)
+                self.music_list_view.setUpdatesEnabled(True)
 
-            # Apply filter immediately after loading
+            # Apply filter immediately after loading (single visibility pass once the batch is complete)
             self._filter_music_list() # This also updates status bar with counts
 
         # Update UI state now that list is populated/cleared
@@ -1640,31 +1978,23 @@ class MainWindow(QMainWindow):
     def _filter_music_list(self):
         """Filtra la lista UI basandosi sul testo nel filter_edit."""
         filter_text = self.filter_edit.text().lower().strip()
-        visible_count = 0
-        total_items = len(self.loaded_music_data)
+        total_items = len(self.loaded_music_data_by_path)
         logging.debug(f"Applicazione filtro: '{filter_text}'")
 
-        self.music_list_widget.setUpdatesEnabled(False)
+        # Filtering is model-side: the proxy matches FILTER_ROLE (file name), case-insensitive substring
+        # Always re-applied (also after a rescan with the same text): re-filters the current rows.
+        # If the current row gets filtered out, the selection model would move "current" to a
+        # neighbouring row: clear it instead, so no track the user didn't pick becomes selected.
+        selection_model = self.music_list_view.selectionModel()
+        previous_item = self._item_from_proxy_index(self.music_list_view.currentIndex())
+        self._filter_in_progress = True
         try:
-            for i in range(self.music_list_widget.count()): # Iterate through widget items directly
-                item = self.music_list_widget.item(i)
-                full_path = item.data(FULL_PATH_ROLE)
-                # Find corresponding file data (should always exist if map is correct)
-                file_data = next((fd for fd in self.loaded_music_data if fd.full_path == full_path), None)
-
-                if item and file_data:
-                     # Check filename (and potentially other fields later)
-                    match = not filter_text or filter_text in file_data.filename.lower()
-                    item.setHidden(not match)
-                    if match:
-                         visible_count += 1
-                elif item:
-                     # Item exists but no data? Hide it.
-                     logging.warning(f"Item '{item.text()}' senza dati corrispondenti nel filtro.")
-                     item.setHidden(True)
-
+            self._list_proxy.setFilterFixedString(filter_text)
+            if previous_item is not None and not self._is_item_visible(previous_item):
+                selection_model.setCurrentIndex(QModelIndex(), QItemSelectionModel.Clear)
         finally:
-            self.music_list_widget.setUpdatesEnabled(True)
+            self._filter_in_progress = False
+        visible_count = self._list_proxy.rowCount()
 
         # Update status bar with filter results
         if filter_text:
@@ -1679,15 +2009,39 @@ class MainWindow(QMainWindow):
         self._update_button_states() # Update buttons based on filter/selection
 
 
-    def _on_current_item_changed(self, current: Optional[QListWidgetItem], previous: Optional[QListWidgetItem]):
+    # --- List model helpers (view rows are proxy indexes, items live in the source model) ---
+    def _item_from_proxy_index(self, proxy_index: QModelIndex) -> Optional[QStandardItem]:
+        """Restituisce l'item del modello sorgente per un indice della vista (proxy)."""
+        if not proxy_index.isValid():
+            return None
+        return self._list_model.itemFromIndex(self._list_proxy.mapToSource(proxy_index))
+
+    def _item_in_list(self, item: Optional[QStandardItem]) -> bool:
+        """True se l'item è ancora nel modello (removeRow/clear distruggono l'item C++)."""
+        try:
+            return item is not None and item.model() is not None
+        except RuntimeError: # Wrapped C++ object already deleted
+            return False
+
+    def _is_item_visible(self, item: Optional[QStandardItem]) -> bool:
+        """True se l'item è nel modello e non escluso dal filtro."""
+        return self._item_in_list(item) and self._list_proxy.mapFromSource(item.index()).isValid()
+
+    def _on_list_double_clicked(self, proxy_index: QModelIndex):
+        item = self._item_from_proxy_index(proxy_index)
+        if item:
+            self._play_selected_music_from_item(item)
+
+    def _on_current_index_changed(self, current_index: QModelIndex, previous_index: QModelIndex):
         """Gestisce cambio selezione nella lista."""
+        if self._filter_in_progress: return # Filter-driven current change: _filter_music_list resolves it
         # Don't log excessively if selection changes rapidly during filtering/loading
-        # logging.debug(f"Selezione cambiata. Corrente: {current.text() if current else 'None'}")
+        current = self._item_from_proxy_index(current_index)
 
         if self.is_preview_playing and self.original_file_for_preview:
              # Stop preview if selection changes away from the item being previewed
              original_item = self.list_item_map.get(self.original_file_for_preview)
-             if current != original_item:
+             if current is not original_item:
                  logging.info("Selezione cambiata durante riproduzione anteprima -> fermo anteprima.")
                  self._stop_playback() # This will also untoggle the button
 
@@ -1695,30 +2049,31 @@ class MainWindow(QMainWindow):
         self._update_button_states()
 
 
-    def _get_selected_item_data(self) -> Tuple[Optional[QListWidgetItem], Optional[str], Optional[MusicFileData]]:
+    def _get_selected_item_data(self) -> Tuple[Optional[QStandardItem], Optional[str], Optional[MusicFileData]]:
         """Ottiene l'item selezionato (se visibile), il suo path e i dati associati."""
-        item = self.music_list_widget.currentItem()
-        if item and not item.isHidden(): # Crucially, check if the item is visible
+        # The view's current index is a proxy index: rows excluded by the filter are never current
+        item = self._item_from_proxy_index(self.music_list_view.currentIndex())
+        if item:
             full_path = item.data(FULL_PATH_ROLE)
             if full_path:
-                # Find the data using the path - more reliable than assuming index sync
-                file_data = next((fd for fd in self.loaded_music_data if fd.full_path == full_path), None)
+                # Find the data using the path (O(1) via map) - more reliable than assuming index sync
+                file_data = self.loaded_music_data_by_path.get(full_path)
                 if file_data:
                     return item, full_path, file_data
                 else:
-                    logging.warning(f"Item selezionato '{item.text()}' ha path '{full_path}' ma dati non trovati in loaded_music_data!")
+                    logging.warning(f"Item selezionato '{item.text()}' ha path '{full_path}' ma dati non trovati in loaded_music_data_by_path!")
                     # Potentially remove item or mark as invalid here? For now, return None.
                     return item, full_path, None # Return item/path but no data
             else:
                 logging.warning(f"Item selezionato '{item.text()}' non ha FULL_PATH_ROLE data.")
         return None, None, None # No selection or hidden item selected
 
-    def _get_selected_item_data_for_item(self, item: QListWidgetItem) -> Tuple[Optional[QListWidgetItem], Optional[str], Optional[MusicFileData]]:
+    def _get_selected_item_data_for_item(self, item: QStandardItem) -> Tuple[Optional[QStandardItem], Optional[str], Optional[MusicFileData]]:
         """Ottiene i dati per un item specifico (passato come argomento)."""
-        if item and not item.isHidden():
+        if self._is_item_visible(item):
             full_path = item.data(FULL_PATH_ROLE)
             if full_path:
-                file_data = next((fd for fd in self.loaded_music_data if fd.full_path == full_path), None)
+                file_data = self.loaded_music_data_by_path.get(full_path)
                 if file_data:
                     return item, full_path, file_data
                 else:
@@ -1731,7 +2086,7 @@ class MainWindow(QMainWindow):
 
     # --- Playback Handling ---
 
-    def _set_playing_indicator(self, item_to_mark: Optional[QListWidgetItem], path_being_played: Optional[str], is_preview: bool):
+    def _set_playing_indicator(self, item_to_mark: Optional[QStandardItem], path_being_played: Optional[str], is_preview: bool):
         """Aggiorna UI per indicare traccia in play (originale o preview)."""
         logging.debug(f"Setting playing indicator: Item={item_to_mark.text() if item_to_mark else 'None'}, Path={os.path.basename(path_being_played or 'None')}, Preview={is_preview}")
         self._reset_playing_indicator() # Clear previous indicator first
@@ -1743,44 +2098,47 @@ class MainWindow(QMainWindow):
         self.original_file_for_preview = item_to_mark.data(FULL_PATH_ROLE) if is_preview and item_to_mark else None
 
         if self.currently_playing_item and self.current_playing_file_path:
-            # Check if the item still exists in the list widget
-            item_row = self.music_list_widget.row(self.currently_playing_item)
-            if item_row >= 0:
+            # Check if the item still exists in the model
+            if self._item_in_list(self.currently_playing_item):
                  # Apply visual indicator (bold font)
                 self.currently_playing_item.setFont(self.playing_font)
-                # Ensure the item is visible
-                self.music_list_widget.scrollToItem(self.currently_playing_item, QAbstractItemView.EnsureVisible)
+                self.currently_playing_item.setData(True, PLAYING_ROLE)
+                # Ensure the item is visible (no-op if the filter hides it)
+                proxy_index = self._list_proxy.mapFromSource(self.currently_playing_item.index())
+                if proxy_index.isValid():
+                    self.music_list_view.scrollTo(proxy_index, QAbstractItemView.EnsureVisible)
 
                 # Update status bar
                 original_path_for_status = self.original_file_for_preview if is_preview else self.current_playing_file_path
                 status_display_name = "Brano sconosciuto"
                 if original_path_for_status:
-                    file_data = next((fd for fd in self.loaded_music_data if fd.full_path == original_path_for_status), None)
+                    file_data = self.loaded_music_data_by_path.get(original_path_for_status)
                     status_display_name = file_data.display_name if file_data else os.path.basename(original_path_for_status)
+                self._current_status_display_name = status_display_name # Cached for _update_ui_for_player_state
 
                 prefix = "ANTEPRIMA: " if is_preview else "Play Orig: "
-                self.show_status_message(f"{prefix}{status_display_name}", persistent=True) # Keep message until stopped/changed
+                kind = StatusKind.PREVIEW if is_preview else StatusKind.PLAY_ORIG
+                self.show_status_message(f"{prefix}{status_display_name}", persistent=True, kind=kind) # Keep message until stopped/changed
 
                 # Get duration and enable controls shortly after play starts
-                QTimer.singleShot(150, self._update_duration_and_controls) # Use timer to allow VLC to load
+                QTimer.singleShot(150, Qt.CoarseTimer, self._update_duration_and_controls) # Use timer to allow VLC to load
             else:
-                 logging.warning(f"Tentativo di marcare come 'in play' un item ('{self.currently_playing_item.text()}') non più presente nella lista.")
+                 logging.warning(f"Tentativo di marcare come 'in play' un item ('{os.path.basename(path_being_played)}') non più presente nella lista.")
                  # Reset state as if stopped
                  self.currently_playing_item = None
                  self.current_playing_file_path = None
                  self.is_preview_playing = False
                  self.original_file_for_preview = None
+                 self._current_status_display_name = None
                  self._set_playback_controls_enabled(False)
-                 if self.progress_timer.isActive(): self.progress_timer.stop()
                  self._cleanup_preview_file() # Ensure temp file is removed if its item vanished
 
         else:
              # Called with None, means playback stopped
+             self._current_status_display_name = None
              self._set_playback_controls_enabled(False)
-             if self.progress_timer.isActive(): self.progress_timer.stop()
              # Update status bar only if it wasn't updated by _set_busy or filter
-             current_status = self.status_message_label.text()
-             if "Play Orig:" in current_status or "ANTEPRIMA:" in current_status or "Pausa" in current_status:
+             if self._status_kind in PLAYER_STATUS_KINDS:
                   self.show_status_message("Pronto.", timeout=STATUS_BAR_TIMEOUT)
 
 
@@ -1789,14 +2147,15 @@ class MainWindow(QMainWindow):
         if self.currently_playing_item:
             try:
                  # Check if item still exists before trying to change font
-                 if self.music_list_widget.row(self.currently_playing_item) >= 0:
-                     if self.currently_playing_item.font() == self.playing_font: # Only reset if it was bold
+                 if self._item_in_list(self.currently_playing_item):
+                     if self.currently_playing_item.data(PLAYING_ROLE): # Only reset if it was bold (flag check, no QFont compare)
                          self.currently_playing_item.setFont(self.default_font)
+                         self.currently_playing_item.setData(False, PLAYING_ROLE)
                          logging.debug(f"Reset indicatore 'in play' per: {self.currently_playing_item.text()}")
                  else:
                      logging.debug("Item precedentemente in play non trovato nella lista per il reset.")
             except RuntimeError:
-                 # Can happen if the list widget is being modified heavily
+                 # Can happen if the model is being modified heavily
                  logging.warning("RuntimeError durante il reset dell'indicatore 'in play'.")
             except Exception as e:
                  logging.warning(f"Errore generico reset indicatore 'in play': {e}")
@@ -1806,15 +2165,16 @@ class MainWindow(QMainWindow):
 
     def _update_duration_and_controls(self):
         """Ottiene la durata dal player e abilita/disabilita controlli UI correlati."""
-        if not self.music_player or not self.music_player.is_ready():
+        if not self._player_ready:
              logging.warning("Tentativo update durata ma player non pronto.")
              return
 
         current_state = self.music_player.get_state()
+        self._vlc_state = current_state # Audit: resync the event-driven cache with the real state
         logging.debug(f"Update durata/controlli richiesto. Stato VLC: {current_state}")
 
         # Only proceed if playing or paused
-        if current_state in [vlc.State.Playing, vlc.State.Paused]:
+        if current_state in _PLAYING_STATES:
              self.current_media_duration_ms = self.music_player.get_length()
              logging.debug(f"Durata media ottenuta da VLC: {self.current_media_duration_ms} ms")
 
@@ -1823,20 +2183,13 @@ class MainWindow(QMainWindow):
                  self.total_time_label.setText(format_time(self.current_media_duration_ms))
                  # Enable playback controls (slider, pause, stop)
                  self._set_playback_controls_enabled(True)
-                 # Start progress timer only if actually playing
-                 if current_state == vlc.State.Playing and not self.progress_timer.isActive():
-                      logging.debug("Avvio timer aggiornamento progresso.")
-                      self.progress_timer.start()
              else:
                   # Length not available (-1 or 0) - might still be opening/buffering
                   logging.warning(f"Durata media non disponibile ({self.current_media_duration_ms} ms). Stato VLC: {current_state}")
                   self.total_time_label.setText("--:--")
                   # Still enable controls, assuming playback might start soon or seeking is possible
                   self._set_playback_controls_enabled(True)
-                  # Try starting timer anyway if state is 'playing', might get length later
-                  if current_state == vlc.State.Playing and not self.progress_timer.isActive():
-                       logging.debug("Avvio timer (anche senza durata iniziale).")
-                       self.progress_timer.start()
+                  # Length might become available later: _update_progress retries on TimeChanged events
 
              # Update pause button text based on current state AFTER enabling controls
              self._update_ui_for_player_state()
@@ -1844,24 +2197,21 @@ class MainWindow(QMainWindow):
         else: # Stopped, Ended, Error etc.
              logging.debug("Stato VLC non Playing/Paused, disabilito controlli.")
              self._set_playback_controls_enabled(False)
-             if self.progress_timer.isActive():
-                  logging.debug("Fermo timer progresso (stato non attivo).")
-                  self.progress_timer.stop()
 
 
-    def _play_selected_music_from_item(self, item: QListWidgetItem):
+    def _play_selected_music_from_item(self, item: QStandardItem):
         """Gestore doppio click su item: riproduce originale."""
         logging.debug(f"Doppio click su: {item.text()}")
         # Ensure item is valid and pass it to the main play function
         self._play_selected_music(item_override=item)
 
 
-    def _play_selected_music(self, item_override: Optional[QListWidgetItem] = None):
+    def _play_selected_music(self, item_override: Optional[QStandardItem] = None):
         """Riproduce l'MP3 originale selezionato o l'item specificato."""
         if self.active_worker_thread and self.active_worker_thread.isRunning():
              QMessageBox.warning(self, "Operazione in Corso", "Impossibile avviare la riproduzione mentre un'altra operazione è attiva.")
              return
-        if not self.music_player or not self.music_player.is_ready():
+        if not self._player_ready:
             QMessageBox.critical(self, "Errore Player", self.music_player.get_init_error() or "Player audio non disponibile.")
             return
 
@@ -1915,12 +2265,12 @@ class MainWindow(QMainWindow):
                      logging.warning("Tentativo di attivare anteprima mentre un'altra operazione è in corso.")
                      QMessageBox.warning(self, "Operazione in Corso", "Impossibile generare l'anteprima mentre un'altra operazione è attiva.")
                      # Force button back to unchecked state visually
-                     self.preview_button.blockSignals(True); self.preview_button.setChecked(False); self.preview_button.blockSignals(False)
+                     self._set_preview_button_silently(False)
                      return
             else: # Cannot start preview if busy and not playing preview
                  logging.warning("Tentativo di attivare anteprima mentre un'altra operazione è in corso.")
                  QMessageBox.warning(self, "Operazione in Corso", "Impossibile generare l'anteprima mentre un'altra operazione è attiva.")
-                 self.preview_button.blockSignals(True); self.preview_button.setChecked(False); self.preview_button.blockSignals(False)
+                 self._set_preview_button_silently(False)
                  return
 
 
@@ -1931,12 +2281,12 @@ class MainWindow(QMainWindow):
             if not selected_item or not source_path or not source_file_data:
                 QMessageBox.warning(self, "Selezione Mancante", "Seleziona un file dalla lista per ascoltare l'anteprima normalizzata.")
                 # Must manually uncheck the button if selection is invalid
-                self.preview_button.blockSignals(True); self.preview_button.setChecked(False); self.preview_button.blockSignals(False)
+                self._set_preview_button_silently(False)
                 return
 
             if not self.lufs_meter:
                 QMessageBox.critical(self, "Errore Normalizzazione", "Impossibile generare anteprima: librerie/meter LUFS non disponibili.")
-                self.preview_button.blockSignals(True); self.preview_button.setChecked(False); self.preview_button.blockSignals(False)
+                self._set_preview_button_silently(False)
                 return
 
             logging.info(f"Richiesta generazione anteprima per: {source_file_data.filename}")
@@ -1956,7 +2306,7 @@ class MainWindow(QMainWindow):
             except Exception as e:
                  logging.error(f"Impossibile creare percorso file temporaneo: {e}", exc_info=True)
                  QMessageBox.critical(self, "Errore File Temporaneo", f"Impossibile creare il file temporaneo per l'anteprima:\n{e}")
-                 self.preview_button.blockSignals(True); self.preview_button.setChecked(False); self.preview_button.blockSignals(False)
+                 self._set_preview_button_silently(False)
                  return
 
             # Store paths for cleanup/state management
@@ -1979,7 +2329,7 @@ class MainWindow(QMainWindow):
                 logging.warning("Avvio worker anteprima fallito.")
                 self.current_preview_temp_path = None # Reset path if worker didn't start
                 self.original_file_for_preview = None
-                self.preview_button.blockSignals(True); self.preview_button.setChecked(False); self.preview_button.blockSignals(False)
+                self._set_preview_button_silently(False)
 
         else:
             # --- STOP PREVIEW (Button untoggled by user or code) ---
@@ -1994,13 +2344,20 @@ class MainWindow(QMainWindow):
                  self.original_file_for_preview = None
                  self._update_button_states() # Update UI
 
+    def _set_preview_button_silently(self, checked: bool):
+        """Imposta lo stato checked del bottone Preview senza emettere 'toggled'."""
+        if self.preview_button.isChecked() == checked:
+            return # Already in the requested state
+        with QSignalBlocker(self.preview_button): # Restores previous blocked state even on exceptions
+            self.preview_button.setChecked(checked)
+
     def _on_preview_generated(self, result: NormalizeWorker.NormalizeResult):
          """Slot chiamato da NormalizeWorker quando l'anteprima è pronta."""
          if not result.success:
              logging.error(f"Generazione anteprima fallita: {result.message}")
              QMessageBox.critical(self, "Errore Generazione Anteprima", f"Impossibile generare l'anteprima per '{os.path.basename(result.original_source_path)}':\n{result.message}")
              self._cleanup_preview_file()
-             self.preview_button.blockSignals(True); self.preview_button.setChecked(False); self.preview_button.blockSignals(False)
+             self._set_preview_button_silently(False)
              # _on_thread_finished will handle unbusy state
              return
 
@@ -2008,12 +2365,12 @@ class MainWindow(QMainWindow):
              logging.error(f"Generazione anteprima OK ma file output ('{result.output_path}') non trovato!")
              QMessageBox.critical(self, "Errore Interno", "Anteprima generata con successo ma file output non trovato.")
              self._cleanup_preview_file()
-             self.preview_button.blockSignals(True); self.preview_button.setChecked(False); self.preview_button.blockSignals(False)
+             self._set_preview_button_silently(False)
              return
 
          # Update measured LUFS in the source file data if available
          if result.measured_lufs is not None and np.isfinite(result.measured_lufs) and result.original_source_path:
-             source_data = next((fd for fd in self.loaded_music_data if fd.full_path == result.original_source_path), None)
+             source_data = self.loaded_music_data_by_path.get(result.original_source_path)
              if source_data:
                  source_data.measured_lufs = result.measured_lufs
                  logging.info(f"LUFS misurato per anteprima di '{source_data.filename}': {result.measured_lufs:.2f}")
@@ -2024,7 +2381,7 @@ class MainWindow(QMainWindow):
          item = self.list_item_map.get(result.original_source_path) # Find original item in list
          if not item:
              logging.warning("Item originale non trovato nella lista dopo generazione anteprima. Annullamento riproduzione.")
-             self._cleanup_preview_file(); self.preview_button.blockSignals(True); self.preview_button.setChecked(False); self.preview_button.blockSignals(False)
+             self._cleanup_preview_file(); self._set_preview_button_silently(False)
              return
 
          if self.music_player.play(result.output_path):
@@ -2037,37 +2394,26 @@ class MainWindow(QMainWindow):
               QMessageBox.critical(self, "Errore Riproduzione Anteprima", f"Impossibile riprodurre il file di anteprima generato:\n{result.output_path}\nVerifica il player VLC e i log.")
               self._cleanup_preview_file()
               self._set_playing_indicator(None, None, False)
-              self.preview_button.blockSignals(True); self.preview_button.setChecked(False); self.preview_button.blockSignals(False)
+              self._set_preview_button_silently(False)
 
 
     def _cleanup_preview_file(self):
-        """Elimina il file WAV temporaneo dell'anteprima, se esiste."""
+        """Elimina (in background) il file WAV temporaneo dell'anteprima, se esiste."""
         path_to_delete = self.current_preview_temp_path
-        if path_to_delete and os.path.exists(path_to_delete):
-            try:
-                os.remove(path_to_delete)
-                logging.info(f"File anteprima temporaneo eliminato: {path_to_delete}")
-            except OSError as e:
-                logging.warning(f"Impossibile eliminare il file anteprima '{path_to_delete}': {e}")
-            except Exception as e:
-                 logging.error(f"Errore imprevisto eliminazione file anteprima '{path_to_delete}': {e}", exc_info=True)
-        elif path_to_delete:
-             # If path variable exists but file doesn't, log as debug
-             logging.debug(f"Pulizia anteprima: Percorso '{path_to_delete}' non trovato su disco.")
-
-        # Always clear the state variables after attempting cleanup
+        # Always clear the state variable immediately, deletion happens off the GUI thread
         self.current_preview_temp_path = None
+        if path_to_delete:
+            QThreadPool.globalInstance().start(FileDeleteRunnable(path_to_delete))
 
 
     def _toggle_pause(self):
         """Gestisce il click sul bottone Pausa/Riprendi."""
-        if self.music_player and self.music_player.is_ready():
+        if self._player_ready:
             state = self.music_player.get_state()
-            if state in [vlc.State.Playing, vlc.State.Paused]:
+            if state in _PLAYING_STATES:
                  logging.debug("Comando Pausa/Riprendi inviato al player.")
                  self.music_player.pause()
-                 # Update UI slightly delayed to reflect state change
-                 QTimer.singleShot(100, self._update_ui_for_player_state)
+                 # UI is updated when VLC reports Paused/Playing (_drain_vlc_events)
             else:
                  logging.debug("Toggle Pausa ignorato: player non in stato Playing/Paused.")
         else:
@@ -2075,18 +2421,31 @@ class MainWindow(QMainWindow):
 
     def _stop_playback(self):
         """Ferma qualsiasi riproduzione (originale o preview) e pulisce lo stato."""
-        if not self.music_player or not self.music_player.is_ready():
+        # Reentrancy guard: stop() can trigger VLC events/slots that call back in here
+        if self._in_stop_playback:
+             logging.debug("Stop già in corso, chiamata annidata ignorata.")
+             return
+        self._in_stop_playback = True
+        try:
+             self._do_stop_playback()
+        finally:
+             self._in_stop_playback = False
+
+    def _do_stop_playback(self):
+        """Corpo di _stop_playback (chiamare solo tramite _stop_playback)."""
+        if not self._player_ready:
              # logging.debug("Stop richiesto ma player non pronto o già fermo.")
              # Ensure cleanup even if player is gone
              was_preview = self.is_preview_playing
              self._set_playing_indicator(None, None, False) # Reset internal state/UI indicators
              self._cleanup_preview_file()
              if was_preview and self.preview_button.isChecked():
-                  self.preview_button.blockSignals(True); self.preview_button.setChecked(False); self.preview_button.blockSignals(False)
+                  self._set_preview_button_silently(False)
              self._update_button_states()
              return
 
         current_state = self.music_player.get_state()
+        self._vlc_state = current_state # Audit: resync the event-driven cache with the real state
         was_playing = current_state != vlc.State.Stopped and current_state != vlc.State.Ended and current_state != vlc.State.Error
         was_preview = self.is_preview_playing # Capture state before changing it
 
@@ -2095,6 +2454,7 @@ class MainWindow(QMainWindow):
         # Send stop command to VLC if it was playing/paused
         if was_playing:
             self.music_player.stop()
+            self._vlc_state = vlc.State.Stopped # Don't wait for the Stopped event to refresh the controls
 
         # --- Always perform cleanup after stop command (or if already stopped) ---
         self._set_playing_indicator(None, None, False) # Resets internal state and UI font/statusbar
@@ -2107,9 +2467,7 @@ class MainWindow(QMainWindow):
         # Ensure the preview button is unchecked if we stopped a preview
         if was_preview and self.preview_button.isChecked():
             logging.debug("Deseleziono il bottone Preview dopo stop.")
-            self.preview_button.blockSignals(True) # Prevent toggled signal loop
-            self.preview_button.setChecked(False)
-            self.preview_button.blockSignals(False)
+            self._set_preview_button_silently(False) # Prevent toggled signal loop
 
         # Update overall UI state
         self._update_button_states()
@@ -2117,116 +2475,135 @@ class MainWindow(QMainWindow):
 
     def _update_ui_for_player_state(self):
         """Aggiorna il testo/icona del bottone Pausa e la status bar in base allo stato del player."""
-        if not self.music_player or not self.music_player.is_ready(): return
+        if not self._player_ready: return
 
-        state = self.music_player.get_state()
-        # Get display name for status bar
-        status_display_name = "Brano sconosciuto"
-        original_path_for_status = self.original_file_for_preview if self.is_preview_playing else self.current_playing_file_path
-        if original_path_for_status:
-            file_data = next((fd for fd in self.loaded_music_data if fd.full_path == original_path_for_status), None)
-            status_display_name = file_data.display_name if file_data else os.path.basename(original_path_for_status)
+        state = self._vlc_state
+        # Display name for status bar, resolved once in _set_playing_indicator
+        status_display_name = self._current_status_display_name or "Brano sconosciuto"
 
-        status_msg = self.status_message_label.text() # Get current message
+        status_msg = self._last_status_msg # Get current message (mirror, no QLabel round-trip)
 
         if state == vlc.State.Playing:
             self.pause_button.setText("❚❚ Pausa")
             self.pause_button.setToolTip("Metti in pausa la riproduzione (P)")
-            self.pause_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPause))
+            self.pause_button.setIcon(self._icon_pause)
             # Update status bar if needed
             prefix = "ANTEPRIMA: " if self.is_preview_playing else "Play Orig: "
+            kind = StatusKind.PREVIEW if self.is_preview_playing else StatusKind.PLAY_ORIG
             expected_msg = f"{prefix}{status_display_name}"
-            if status_msg != expected_msg: self.show_status_message(expected_msg, persistent=True)
-            # Ensure timer is running
-            if not self.progress_timer.isActive(): self.progress_timer.start()
+            if status_msg != expected_msg: self.show_status_message(expected_msg, persistent=True, kind=kind)
 
         elif state == vlc.State.Paused:
             self.pause_button.setText("▶ Riprendi")
             self.pause_button.setToolTip("Riprendi la riproduzione (P)")
-            self.pause_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
+            self.pause_button.setIcon(self._icon_play)
              # Update status bar if needed
             prefix = "Pausa Anteprima: " if self.is_preview_playing else "Pausa Orig: "
+            kind = StatusKind.PAUSE_PREVIEW if self.is_preview_playing else StatusKind.PAUSE_ORIG
             expected_msg = f"{prefix}{status_display_name}"
-            if status_msg != expected_msg: self.show_status_message(expected_msg, persistent=True)
-            # Stop timer when paused
-            if self.progress_timer.isActive(): self.progress_timer.stop()
+            if status_msg != expected_msg: self.show_status_message(expected_msg, persistent=True, kind=kind)
 
         else: # Stopped, Ended, Error, etc.
             self.pause_button.setText("❚❚ Pausa")
             self.pause_button.setToolTip("Metti in pausa / Riprendi la riproduzione (P)")
-            self.pause_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPause))
+            self.pause_button.setIcon(self._icon_pause)
             # If playback implicitly stopped (e.g. finished), update status
-            if "Play Orig:" in status_msg or "ANTEPRIMA:" in status_msg or "Pausa" in status_msg:
+            if self._status_kind in PLAYER_STATUS_KINDS:
                 # Check if an operation is running in background before setting "Pronto"
                 if not (self.active_worker_thread and self.active_worker_thread.isRunning()):
                     self.show_status_message("Pronto.", timeout=STATUS_BAR_TIMEOUT)
-            # Ensure timer is stopped
-            if self.progress_timer.isActive(): self.progress_timer.stop()
 
 
-    # --- Playback Progress/Seek/Volume --- (Largely unchanged logic)
-    def _update_progress(self):
-        """Aggiorna slider e label tempo durante la riproduzione."""
-        if not self.music_player or not self.music_player.is_ready() or self.is_progress_slider_dragging:
-             # logging.debug("Update progress skipped (player not ready or slider dragging).")
+    # --- Playback Progress/Seek/Volume ---
+    def _update_progress(self, time_ms: int):
+        """Aggiorna slider e label tempo (slot per l'evento VLC MediaPlayerTimeChanged)."""
+        if self._in_stop_playback or self.is_progress_slider_dragging or not self.current_playing_file_path:
+             # Stopping, slider being dragged, or stale event queued before playback was stopped
              return
 
-        state = self.music_player.get_state()
-        # logging.debug(f"Update progress tick. State: {state}") # Too verbose
-
-        if state == vlc.State.Playing:
-             current_pos = self.music_player.get_position() # Float 0.0 to 1.0
-             current_length_ms = self.current_media_duration_ms
-
+        current_length_ms = self.current_media_duration_ms
+        if current_length_ms <= 0 and self._player_ready:
+             # Length may become known only after playback has started
+             current_length_ms = self.music_player.get_length()
              if current_length_ms > 0:
-                 # Update time labels
-                 current_time_ms = int(current_pos * current_length_ms)
-                 self.current_time_label.setText(format_time(current_time_ms))
-
-                 # Update slider (map 0.0-1.0 to 0-1000)
-                 slider_max = self.progress_slider.maximum()
-                 slider_pos = int(current_pos * slider_max)
-
-                 # Update slider only if position changed significantly to avoid jitter
-                 # or blocking updates during seeking. Maybe increase threshold?
-                 current_slider_val = self.progress_slider.value()
-                 if abs(slider_pos - current_slider_val) > (slider_max * 0.002): # Threshold ~2ms for 1sec range?
-                    self.progress_slider.setValue(slider_pos)
-             else:
-                  # Still playing but length unknown, maybe show percentage?
-                  self.current_time_label.setText(f"{int(current_pos * 100)}%")
-                  # Update slider anyway
-                  self.progress_slider.setValue(int(current_pos * self.progress_slider.maximum()))
-
+                 self.current_media_duration_ms = current_length_ms
+                 self.total_time_label.setText(format_time(current_length_ms))
 
-        elif state == vlc.State.Ended:
-             logging.info("Playback terminato (stato VLC: Ended). Fermo e pulisco.")
-             self._stop_playback() # Call standard stop procedure
-             # Optional: auto-play next? -> Needs different logic
-
-        elif state == vlc.State.Error:
-             logging.error("Errore Player VLC rilevato durante playback.")
-             self._stop_playback() # Stop and cleanup
+        if current_length_ms > 0:
+             current_pos = min(1.0, max(0.0, time_ms / current_length_ms))
+             time_text = format_time(time_ms)
+        else:
+             # Still playing but length unknown, show percentage
+             current_pos = self.music_player.get_position() if self.music_player else 0.0
+             time_text = f"{int(current_pos * 100)}%"
+
+        # Quantize the slider position: setValue only when the bucket changes (avoids jitter/paint per tick)
+        slider_value = None
+        bucket = int(current_pos * PROGRESS_SLIDER_BUCKETS)
+        if bucket != self._last_slider_bucket:
+             self._last_slider_bucket = bucket
+             slider_value = bucket * (PROGRESS_SLIDER_MAX // PROGRESS_SLIDER_BUCKETS)
+        # Same for the time label: only when the displayed text changes
+        if time_text == self._last_time_text:
+             time_text = None
+        else:
+             self._last_time_text = time_text
+
+        if slider_value is not None or time_text is not None:
+             self._queue_progress_update(slider_value, time_text)
+
+    def _reset_progress_cache(self):
+        """Invalida lo stato 'ultimo valore mostrato' (dopo seek/stop lo slider/label sono stati cambiati altrove)."""
+        self._last_slider_bucket = -1
+        self._last_time_text = None
+
+    def _queue_progress_update(self, slider_value: Optional[int], time_text: Optional[str]):
+        """Memorizza l'ultimo progresso e pianifica un solo flush per giro di event loop."""
+        if slider_value is not None:
+             self._pending_slider_value = slider_value
+        if time_text is not None:
+             self._pending_time_text = time_text
+        if not self._slider_flush_pending:
+             self._slider_flush_pending = True
+             QTimer.singleShot(0, self._flush_progress) # Runs after pending input/paint events are processed
+
+    def _flush_progress(self):
+        """Applica l'ultimo aggiornamento di progresso in attesa (un solo setText/setValue)."""
+        self._slider_flush_pending = False
+        slider_value, time_text = self._pending_slider_value, self._pending_time_text
+        self._pending_slider_value = None
+        self._pending_time_text = None
+        if self.is_progress_slider_dragging or not self.current_playing_file_path:
+             return # User is seeking, or playback stopped meanwhile
+        if time_text is not None:
+             self.current_time_label.setText(time_text)
+        if slider_value is not None:
+             with QSignalBlocker(self.progress_slider): # Programmatic update must never trigger a seek
+                 self.progress_slider.setValue(slider_value)
+
+    def _on_playback_ended(self):
+        """Slot per l'evento VLC MediaPlayerEndReached."""
+        if not self.current_playing_file_path:
+             return # Already stopped
+        logging.info("Playback terminato (evento VLC EndReached). Fermo e pulisco.")
+        self._stop_playback() # Call standard stop procedure
+        # Optional: auto-play next? -> Needs different logic
+
+    def _on_playback_error(self):
+        """Slot per l'evento VLC MediaPlayerEncounteredError."""
+        logging.error("Errore Player VLC rilevato durante playback.")
+        was_active = bool(self.current_playing_file_path)
+        self._stop_playback() # Stop and cleanup
+        if was_active:
              QMessageBox.warning(self, "Errore Player", "Si è verificato un errore nel player VLC durante la riproduzione.")
 
-        elif state == vlc.State.Stopped:
-             # Can happen if stop was called but timer fired again before being stopped
-             logging.debug("Player in stato Stopped durante update progress, fermo timer.")
-             if self.progress_timer.isActive(): self.progress_timer.stop()
-             # Might need to ensure UI reflects stopped state if _stop_playback wasn't called explicitly
-             if self.currently_playing_item or self.is_preview_playing:
-                   logging.warning("Stato VLC = Stopped, ma UI indica ancora riproduzione. Forzo stop UI.")
-                   self._stop_playback()
-
 
     def _progress_slider_pressed(self):
         """Chiamato quando l'utente inizia a trascinare lo slider."""
-        state = self.music_player.get_state()
-        if state in [vlc.State.Playing, vlc.State.Paused]:
+        state = self._vlc_state
+        if state in _PLAYING_STATES:
             self.is_progress_slider_dragging = True
-            logging.debug("Slider Pressed.")
-            # Temporarily stop the progress timer updates to avoid conflicts
-            if self.progress_timer.isActive(): self.progress_timer.stop()
+            logging.debug("Slider Pressed.") # TimeChanged updates are ignored while dragging
         else:
              self.is_progress_slider_dragging = False # Ensure flag is reset if not playable
 
@@ -2238,24 +2615,21 @@ class MainWindow(QMainWindow):
             new_position = float(new_value) / self.progress_slider.maximum()
             logging.info(f"Slider Released at value {new_value} -> seek to position {new_position:.3f}")
             self.music_player.set_position(new_position)
+            self._reset_progress_cache() # Slider/label now show the seek target, not the last pushed values
             # Update time label immediately based on seek position
             if self.current_media_duration_ms > 0:
                 self.current_time_label.setText(format_time(int(new_position * self.current_media_duration_ms)))
-            # Restart timer only if it was active before and player is still playing
-            if self.music_player.get_state() == vlc.State.Playing:
-                 if not self.progress_timer.isActive(): self.progress_timer.start()
         else:
              # Handle click seek (slider value changed without dragging)
-             state = self.music_player.get_state()
-             if state in [vlc.State.Playing, vlc.State.Paused]:
+             state = self._vlc_state
+             if state in _PLAYING_STATES:
                  new_value = self.progress_slider.value()
                  new_position = float(new_value) / self.progress_slider.maximum()
                  logging.info(f"Slider Click -> seek to position {new_position:.3f}")
                  self.music_player.set_position(new_position)
+                 self._reset_progress_cache()
                  if self.current_media_duration_ms > 0:
                      self.current_time_label.setText(format_time(int(new_position * self.current_media_duration_ms)))
-                 # Timer restart handled by normal update loop? Or restart here if playing?
-                 # if state == vlc.State.Playing and not self.progress_timer.isActive(): self.progress_timer.start()
 
 
     def _progress_slider_moved(self, value):
@@ -2268,7 +2642,7 @@ class MainWindow(QMainWindow):
 
     def _set_volume(self, value):
         """Imposta il volume del player VLC quando lo slider cambia."""
-        if self.music_player and self.music_player.is_ready():
+        if self._player_ready:
             self.music_player.set_volume(value)
             # Volume label text is updated automatically via lambda connection
 
@@ -2288,7 +2662,12 @@ class MainWindow(QMainWindow):
              QMessageBox.warning(self, "Selezione Mancante", "Seleziona un file dalla lista da normalizzare e spostare.")
              return
 
-        if not self.current_base_output_dir or not os.path.isdir(self.current_base_output_dir):
+        if self._path_validate_signals is not None:
+             logging.debug("Verifica destinazione già in corso, richiesta ignorata.")
+             return
+
+        # Fast path on the UI thread: string checks only (isdir/exists run in the thread pool)
+        if not self.current_base_output_dir:
              QMessageBox.warning(self, "Cartella Output Mancante", "Seleziona una Cartella Base Output valida prima di spostare i file.")
              return
 
@@ -2304,30 +2683,46 @@ class MainWindow(QMainWindow):
 
         # Clean and validate relative path
         try:
-             # Replace backslashes, normalize, remove leading/trailing slashes
-             cleaned_relative = os.path.normpath(relative_subfolder.replace("\\", "/")).strip(os.sep)
-             # Basic sanity checks
-             if not cleaned_relative or os.path.isabs(cleaned_relative) or ".." in cleaned_relative.split(os.sep):
-                  raise ValueError("Percorso relativo non valido o non sicuro.")
-             # Check for invalid characters (basic check, OS specific might be needed)
-             # invalid_chars = '<>:"/\\|?*' # Example, might vary by OS
-             # if any(c in invalid_chars for c in cleaned_relative):
-             #      raise ValueError("Il nome della sottocartella contiene caratteri non validi.")
-
-             destination_folder = os.path.join(self.current_base_output_dir, cleaned_relative)
-
+             cleaned_relative = PathValidateRunnable.clean_relative_subfolder(relative_subfolder)
         except ValueError as path_err:
             QMessageBox.critical(self, "Errore Percorso Sottocartella", f"Il percorso sottocartella specificato non è valido:\n'{relative_subfolder}'\n\n({path_err})\n\nNon usare percorsi assoluti, '..' o caratteri speciali.")
             self.subfolder_edit.selectAll(); self.subfolder_edit.setFocus()
             return
-        except Exception as e: # Catch other unexpected errors during path join/validation
-             QMessageBox.critical(self, "Errore Percorso", f"Errore imprevisto nella gestione del percorso di destinazione:\n{e}")
+
+        # Disk checks (isdir/exists) off the UI thread; continues in _on_destination_validated
+        runnable = PathValidateRunnable(self.current_base_output_dir, cleaned_relative, source_path)
+        self._path_validate_signals = runnable.signals # Keep the QObject alive until the result arrives
+        runnable.signals.finished.connect(self._on_destination_validated, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(runnable)
+
+    def _on_destination_validated(self, result: PathValidateRunnable.ValidationResult):
+        """Slot (thread UI) con l'esito della verifica destinazione: mostra i dialoghi e avvia il worker."""
+        self._path_validate_signals = None
+        if self.active_worker_thread and self.active_worker_thread.isRunning():
+             QMessageBox.warning(self, "Operazione in Corso", "Attendere il completamento dell'operazione corrente prima di spostare un altro file.")
+             return
+
+        source_path = result.source_path
+        cleaned_relative = result.cleaned_relative
+        # The list may have changed while the check was running
+        selected_item = self.list_item_map.get(source_path)
+        source_file_data = self.loaded_music_data_by_path.get(source_path)
+        if not selected_item or not source_file_data:
+             logging.warning(f"File '{source_path}' non più presente nella lista dopo la verifica destinazione.")
+             return
+
+        if result.error:
+             QMessageBox.critical(self, "Errore Percorso", f"Errore imprevisto nella gestione del percorso di destinazione:\n{result.error}")
+             return
+        if not result.base_dir_ok:
+             self._set_output_dir_valid(False) # Folder vanished since it was selected: refresh the cached state
+             self._update_button_states()
+             QMessageBox.warning(self, "Cartella Output Mancante", "Seleziona una Cartella Base Output valida prima di spostare i file.")
              return
 
-        # Define destination WAV filename
         source_basename = os.path.basename(source_path)
-        destination_filename_wav = f"{os.path.splitext(source_basename)[0]}.wav"
-        destination_file_path_wav = os.path.join(destination_folder, destination_filename_wav)
+        destination_file_path_wav = result.destination_file_path_wav
+        destination_filename_wav = os.path.basename(destination_file_path_wav)
 
         logging.info(f"Richiesta Normalizza/Sposta per: '{source_basename}'")
         logging.info(f"  -> Sorgente: {source_path}")
@@ -2335,8 +2730,8 @@ class MainWindow(QMainWindow):
         logging.info(f"  -> MP3 Originale verrà ELIMINATO dopo successo.")
 
         # --- Confirmation ---
-        # Check if destination WAV exists
-        if os.path.exists(destination_file_path_wav):
+        # Check if destination WAV exists (checked in the thread pool)
+        if result.destination_exists:
              overwrite_reply = QMessageBox.question(self, 'File Esistente',
                                           f"Il file WAV di destinazione esiste già:\n'{destination_filename_wav}'\n\nin: ...{os.sep}{cleaned_relative}\n\nSovrascriverlo?",
                                           QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
@@ -2351,19 +2746,27 @@ class MainWindow(QMainWindow):
         if source_file_data.measured_lufs is not None and np.isfinite(source_file_data.measured_lufs):
             original_lufs_str = f"\n(LUFS Originale Misurato: {source_file_data.measured_lufs:.1f} LUFS)"
         # Add target LUFS info
-        confirm_msg = (
-             f"<b>Confermi l'operazione?</b><br><br>"
-             f"<b>File:</b> '{source_file_data.display_name}'<br>"
-             f"<b>Azione:</b> Normalizza a <b>{self.target_lufs:.1f} LUFS</b> e Salva come WAV<br>"
-             f"<b>Destinazione:</b> ...{os.sep}{os.path.basename(self.current_base_output_dir)}{os.sep}<b>{cleaned_relative}</b><br>"
-             f"<b>Nuovo Nome File:</b> '{destination_filename_wav}'<br>"
-             f"{original_lufs_str}<br><br>"
-             f"<font color='orange'><b>ATTENZIONE:</b> Il file MP3 originale ('{source_basename}') sarà <b>eliminato definitivamente</b> se l'operazione riesce.</font>"
+        confirm_msg = _CONFIRM_TMPL.format(
+             display_name=source_file_data.display_name,
+             target_lufs=self.target_lufs,
+             sep=os.sep,
+             base_name=os.path.basename(self.current_base_output_dir),
+             relative=cleaned_relative,
+             wav_name=destination_filename_wav,
+             original_lufs=original_lufs_str,
+             source_name=source_basename,
         )
 
-        # Show confirmation dialog
-        confirm_reply = QMessageBox.question(self, 'Conferma Normalizzazione e Spostamento', confirm_msg,
-                                            QMessageBox.Yes | QMessageBox.Cancel, QMessageBox.Cancel)
+        # Show confirmation dialog (one QMessageBox reused across moves)
+        if self._confirm_box is None:
+             self._confirm_box = QMessageBox(self)
+             self._confirm_box.setIcon(QMessageBox.Question)
+             self._confirm_box.setWindowTitle('Conferma Normalizzazione e Spostamento')
+             self._confirm_box.setTextFormat(Qt.RichText)
+        self._confirm_box.setText(confirm_msg)
+        self._confirm_box.setStandardButtons(QMessageBox.Yes | QMessageBox.Cancel)
+        self._confirm_box.setDefaultButton(QMessageBox.Cancel)
+        confirm_reply = self._confirm_box.exec_()
 
         if confirm_reply != QMessageBox.Yes:
             logging.info("Operazione Normalizza/Sposta annullata dall'utente.")
@@ -2378,11 +2781,35 @@ class MainWindow(QMainWindow):
                (self.is_preview_playing and self.original_file_for_preview == source_path):
                is_playing_this = True
 
+        norm_worker_args = {
+            "source_path": source_path,
+            "destination_path": destination_file_path_wav, # Dest is WAV
+        }
         if is_playing_this:
              logging.info(f"Il file da spostare ('{source_basename}') è attualmente in riproduzione/anteprima. Fermo la riproduzione...")
+             # Continue when VLC reports Stopped; the timer covers the case where no event arrives
+             self._pending_move_args = norm_worker_args
              self._stop_playback()
-             time.sleep(0.1) # Allow stop to process
+             QTimer.singleShot(100, Qt.CoarseTimer, self._continue_pending_move)
+             return
+
+        self._move_stage2_after_stop(norm_worker_args)
 
+    def _continue_pending_move(self):
+        """Riprende lo spostamento rimasto in attesa dello stop del player (evento Stopped o timer, il primo che arriva)."""
+        norm_worker_args = self._pending_move_args
+        if norm_worker_args is None:
+             return # Already continued (or no move pending)
+        self._pending_move_args = None
+        self._move_stage2_after_stop(norm_worker_args)
+
+    def _move_stage2_after_stop(self, norm_worker_args: Dict[str, Any]):
+        """Seconda fase dello spostamento (player già fermo): avvia il NormalizeWorker."""
+        source_path = norm_worker_args["source_path"]
+        source_basename = os.path.basename(source_path)
+        if source_path not in self.loaded_music_data_by_path:
+             logging.warning(f"Spostamento annullato: '{source_basename}' non è più nella lista.")
+             return
 
         # --- Start Worker ---
         logging.info("Avvio worker per normalizzazione e spostamento...")
@@ -2391,7 +2818,7 @@ class MainWindow(QMainWindow):
             lufs_meter=self.lufs_meter,
             target_lufs=self.target_lufs,
             source_path=source_path,
-            destination_path=destination_file_path_wav, # Dest is WAV
+            destination_path=norm_worker_args["destination_path"],
             is_preview=False, # This is the final move operation
             delete_original_on_success=True # Request deletion of original
         )
@@ -2403,15 +2830,17 @@ class MainWindow(QMainWindow):
 
     def _on_normalize_move_finished(self, result: NormalizeWorker.NormalizeResult):
         """Slot chiamato quando NormalizeWorker (in modalità spostamento) finisce."""
-        logging.info(f"Worker Normalizza/Sposta terminato per '{os.path.basename(result.original_source_path)}'. Norm OK: {result.success}, Delete OK: {result.delete_success}")
+        source_basename = os.path.basename(result.original_source_path)
+        logging.info(f"Worker Normalizza/Sposta terminato per '{source_basename}'. Norm OK: {result.success}, Delete OK: {result.delete_success}")
 
-        # Find the original item in the list
+        # Find the original item and its data (one dict lookup each, before the item may be removed)
         original_item = self.list_item_map.get(result.original_source_path)
+        source_data = self.loaded_music_data_by_path.get(result.original_source_path)
 
         if result.success:
              # --- Normalization Successful ---
              success_message_parts = [
-                 f"'{os.path.basename(result.original_source_path)}' normalizzato e salvato con successo.",
+                 f"'{source_basename}' normalizzato e salvato con successo.",
                  f"Messaggio: {result.message}.",
              ]
              final_lufs = result.measured_lufs
@@ -2419,10 +2848,8 @@ class MainWindow(QMainWindow):
                  success_message_parts.append(f"LUFS Originale Misurato: {final_lufs:.1f} LUFS.")
              else:
                  # Try getting LUFS from original data if measurement failed/skipped but data existed
-                 if original_item:
-                      source_data = next((fd for fd in self.loaded_music_data if fd.full_path == result.original_source_path), None)
-                      if source_data and source_data.measured_lufs is not None and np.isfinite(source_data.measured_lufs):
-                           success_message_parts.append(f"LUFS Originale (pre-misurato): {source_data.measured_lufs:.1f} LUFS.")
+                 if source_data and source_data.measured_lufs is not None and np.isfinite(source_data.measured_lufs):
+                      success_message_parts.append(f"LUFS Originale (pre-misurato): {source_data.measured_lufs:.1f} LUFS.")
 
              # Now check deletion status
              if result.delete_success is None: # Should not happen if norm succeeded and delete was requested
@@ -2433,7 +2860,7 @@ class MainWindow(QMainWindow):
                   # --- Deletion Successful ---
                   success_message_parts.append("\nMP3 Originale eliminato con successo.")
                   logging.info("Normalizzazione e eliminazione completate con successo.")
-                  self.show_status_message(f"Spostato: {os.path.basename(result.original_source_path)}", STATUS_BAR_TIMEOUT * 2)
+                  self.show_status_message(f"Spostato: {source_basename}", STATUS_BAR_TIMEOUT * 2)
 
                   # Update UI: Remove item, add recent folder, clear input
                   if original_item:
@@ -2457,24 +2884,24 @@ class MainWindow(QMainWindow):
              else:
                   # --- Deletion Failed ---
                   logging.error(f"Normalizzazione OK, ma eliminazione originale fallita: {result.delete_message}")
-                  success_message_parts.append(f"\n\n<font color='orange'><b>ATTENZIONE: Eliminazione file MP3 originale ('{os.path.basename(result.original_source_path)}') fallita!</b></font>")
+                  success_message_parts.append(f"\n\n<font color='orange'><b>ATTENZIONE: Eliminazione file MP3 originale ('{source_basename}') fallita!</b></font>")
                   if result.delete_message:
                       success_message_parts.append(f"Motivo: {result.delete_message}")
                   success_message_parts.append("\nIl file WAV normalizzato è stato creato.")
                   # Do NOT remove item from list as original still exists
                   QMessageBox.warning(self, "Completato con Avviso", "\n".join(success_message_parts))
-                  self.show_status_message(f"Norm. OK, Elim. Fallita: {os.path.basename(result.original_source_path)}", STATUS_BAR_TIMEOUT * 3)
+                  self.show_status_message(f"Norm. OK, Elim. Fallita: {source_basename}", STATUS_BAR_TIMEOUT * 3)
 
         else:
              # --- Normalization Failed ---
-             logging.error(f"Normalizzazione fallita per '{os.path.basename(result.original_source_path)}': {result.message}")
+             logging.error(f"Normalizzazione fallita per '{source_basename}': {result.message}")
              error_msg = (
-                  f"Errore durante la normalizzazione/salvataggio di:\n'{os.path.basename(result.original_source_path)}'\n\n"
+                  f"Errore durante la normalizzazione/salvataggio di:\n'{source_basename}'\n\n"
                   f"Motivo: {result.message}\n\n"
                   "Il file originale NON è stato modificato o eliminato."
              )
              QMessageBox.critical(self, "Errore Operazione", error_msg)
-             self.show_status_message(f"Errore Normalizzazione: {os.path.basename(result.original_source_path)}", STATUS_BAR_TIMEOUT * 3)
+             self.show_status_message(f"Errore Normalizzazione: {source_basename}", STATUS_BAR_TIMEOUT * 3)
              # Do not remove item from list
 
         # Update button states regardless of outcome (thread completion handles busy state)
@@ -2492,26 +2919,50 @@ class MainWindow(QMainWindow):
 
         logging.debug(f"Aggiungo cartella recente: '{norm_path}'")
         # Remove if already exists to move it to the top
-        if norm_path in self.recent_folders:
-            self.recent_folders.remove(norm_path)
-        # Insert at the beginning
-        self.recent_folders.insert(0, norm_path)
-        # Trim list to max size
-        self.recent_folders = self.recent_folders[:MAX_RECENT_FOLDERS]
-
-        # Update ComboBox
-        self.recent_folder_combo.blockSignals(True) # Avoid triggering currentIndexChanged
-        self.recent_folder_combo.clear()
-        self.recent_folder_combo.addItem("--- Seleziona Recente ---") # Placeholder
-        self.recent_folder_combo.addItems(self.recent_folders)
-        self.recent_folder_combo.setCurrentIndex(0) # Reset selection
-        self.recent_folder_combo.blockSignals(False)
-
-        # Save updated list to settings
-        self.settings.setValue(SETTINGS_RECENT_FOLDERS, self.recent_folders)
+        old_index = self.recent_folders.index(norm_path) if norm_path in self.recent_folders else -1
+        if old_index > 0:
+            del self.recent_folders[old_index]
+        if old_index != 0:
+            # Insert at the beginning and trim list to max size
+            self.recent_folders.insert(0, norm_path)
+            del self.recent_folders[MAX_RECENT_FOLDERS:]
+        self._has_recents = True # norm_path is now (or already was) at the top
+
+        # Update ComboBox incrementally: it mirrors [placeholder] + self.recent_folders,
+        # so combo row = list index + 1. Avoids a full clear()/addItems() rebuild.
+        combo = self.recent_folder_combo
+        combo.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(combo): # Avoid triggering currentIndexChanged
+                if old_index != 0: # Already on top -> nothing to move
+                    if old_index > 0:
+                        combo.removeItem(old_index + 1)
+                    combo.insertItem(1, norm_path)
+                    while combo.count() > MAX_RECENT_FOLDERS + 1:
+                        combo.removeItem(combo.count() - 1)
+                combo.setCurrentIndex(0) # Reset selection
+        finally:
+            combo.setUpdatesEnabled(True)
+
+        # Save updated list to settings on the next event-loop pass (rapid adds -> one write)
+        if not self._settings_flush_pending:
+            self._settings_flush_pending = True
+            QTimer.singleShot(0, Qt.CoarseTimer, self._flush_recent_settings)
         logging.debug(f"Cartelle recenti aggiornate: {self.recent_folders}")
         self._update_button_states() # Update UI state (e.g., enable combo if now has items)
 
+    def _flush_recent_settings(self):
+        """Scrive in QSettings la lista cartelle recenti (una volta per raffica di aggiornamenti)."""
+        self._settings_flush_pending = False
+        self._set_setting_if_changed(SETTINGS_RECENT_FOLDERS, list(self.recent_folders))
+
+    def _set_setting_if_changed(self, key: str, value: Any):
+        """Scrive in QSettings solo se il valore differisce dall'ultimo caricato/salvato."""
+        if key in self._saved_setting_values and self._saved_setting_values[key] == value:
+            return
+        self.settings.setValue(key, value)
+        self._saved_setting_values[key] = value
+
     def _recent_folder_selected(self, index: int):
         """Popola il campo subfolder_edit quando un item recente è selezionato."""
         if index > 0: # Index 0 is the placeholder
@@ -2524,65 +2975,76 @@ class MainWindow(QMainWindow):
              self.subfolder_edit.clear()
 
 
-    def _remove_item_from_list(self, item_to_remove: QListWidgetItem):
-        """Rimuove un item dalla QListWidget, dalla mappa e dalla lista dati."""
+    def _remove_item_from_list(self, item_to_remove: QStandardItem):
+        """Rimuove un item dal modello della lista, dalla mappa e dalla lista dati."""
+        if not self._item_in_list(item_to_remove):
+             logging.warning("Tentativo di rimuovere un item non più presente nel modello della lista.")
+             return
         path = item_to_remove.data(FULL_PATH_ROLE)
-        row = self.music_list_widget.row(item_to_remove)
+        # Row comes from the item itself (model-side), no QListWidget::row() scan and no
+        # path -> row map to keep in sync: removeRow shifts later rows automatically
+        row = item_to_remove.row()
 
         if row >= 0:
              logging.info(f"Rimozione item '{item_to_remove.text()}' (path: {path}) dalla lista.")
-             # 1. Remove from QListWidget
-             taken_item = self.music_list_widget.takeItem(row)
-             # takeItem returns the item, delete it properly later if needed? Usually not.
-             # del taken_item
-
-             # 2. Remove from path -> item map
-             if path in self.list_item_map:
-                 del self.list_item_map[path]
-                 logging.debug(f"  - Rimosso dalla mappa.")
-             else:
-                 logging.warning(f"  - Path '{path}' non trovato nella mappa durante rimozione.")
-
-             # 3. Remove from underlying data list
-             initial_data_len = len(self.loaded_music_data)
-             self.loaded_music_data = [fd for fd in self.loaded_music_data if fd.full_path != path]
-             final_data_len = len(self.loaded_music_data)
-
-             if final_data_len == initial_data_len - 1:
-                 logging.debug(f"  - Rimosso dalla lista dati.")
-             elif final_data_len == initial_data_len:
-                 logging.warning(f"  - Path '{path}' non trovato nella lista dati durante rimozione.")
-             else: # Should not happen with single selection/removal
-                  logging.error(f"  - Discrepanza lunghezza lista dati dopo rimozione! ({initial_data_len} -> {final_data_len})")
-
-             # Update filter counts / status bar might be needed if filter active?
-             # For simplicity, just update button states for now.
+             if self.currently_playing_item is item_to_remove:
+                 self.currently_playing_item = None # removeRow deletes the item
+             # Freeze repaints: removal + filter pass produce a single repaint
+             self.music_list_view.setUpdatesEnabled(False)
+             try:
+                 # 1. Remove from the source model (the proxy/view follow via rowsRemoved)
+                 self._list_model.removeRow(row)
+
+                 # 2. Remove from path -> item map
+                 if path in self.list_item_map:
+                     del self.list_item_map[path]
+                     logging.debug(f"  - Rimosso dalla mappa.")
+                 else:
+                     logging.warning(f"  - Path '{path}' non trovato nella mappa durante rimozione.")
+
+                 # 3. Remove from underlying data store (O(1))
+                 if self.loaded_music_data_by_path.pop(path, None) is not None:
+                     logging.debug(f"  - Rimosso dalla lista dati.")
+                 else:
+                     logging.warning(f"  - Path '{path}' non trovato nella lista dati durante rimozione.")
+
+                 # Refresh status bar message if list becomes empty or based on filter
+                 self._filter_music_list()
+             finally:
+                 self.music_list_view.setUpdatesEnabled(True)
              self._update_button_states()
-             # Refresh status bar message if list becomes empty or based on filter
-             self._filter_music_list()
 
 
         else:
-             logging.warning(f"Tentativo di rimuovere un item ('{item_to_remove.text()}' / '{path}') non trovato nella QListWidget (row={row}).")
+             logging.warning(f"Tentativo di rimuovere un item ('{item_to_remove.text()}' / '{path}') non trovato nel modello (row={row}).")
 
 
     # --- UI State Management ---
+    def _set_tooltip_by_key(self, widget: QWidget, tooltips: Dict[str, str], key: str):
+        """Imposta il tooltip precomputato per 'key' solo se cambia rispetto all'ultimo impostato."""
+        if self._last_tooltip_keys.get(widget) != key:
+            widget.setToolTip(tooltips[key])
+            self._last_tooltip_keys[widget] = key
+
     def _update_button_states(self):
+        """Pianifica l'aggiornamento dello stato dei controlli (più richieste ravvicinate -> un solo aggiornamento)."""
+        if not self._ui_update_timer.isActive():
+            self._ui_update_timer.start()
+
+    def _do_update_button_states(self):
         """Aggiorna lo stato (enabled/disabled) dei bottoni e controlli UI."""
         # Ignore updates if busy, except for playback controls handled by _set_busy
         is_busy = self.active_worker_thread is not None and self.active_worker_thread.isRunning()
         if is_busy:
             # If busy, most controls are handled by _set_busy(True).
             # We only need to potentially manage playback buttons based on player state.
-            is_playing_vlc = self.music_player.get_state() in [vlc.State.Playing, vlc.State.Paused]
-            self.pause_button.setEnabled(is_playing_vlc)
-            self.stop_button.setEnabled(is_playing_vlc)
+            is_playing_vlc = self._vlc_state in _PLAYING_STATES
+            _set_enabled(self.pause_button, is_playing_vlc)
+            _set_enabled(self.stop_button, is_playing_vlc)
             # Make sure preview button remains correctly synced if busy AND preview playing
-            self.preview_button.blockSignals(True)
-            self.preview_button.setChecked(self.is_preview_playing)
-            self.preview_button.blockSignals(False)
+            self._set_preview_button_silently(self.is_preview_playing)
             # Play button should remain disabled while busy
-            self.play_button.setEnabled(False)
+            _set_enabled(self.play_button, False)
             return
 
         # --- State Evaluation (when not busy) ---
@@ -2590,61 +3052,59 @@ class MainWindow(QMainWindow):
         is_selection_valid = selected_item is not None # Check only if an item is selected and visible
 
         can_normalize = _numpy_installed and _soundfile_installed and _pyloudnorm_installed and self.lufs_meter is not None
-        is_output_dir_valid = bool(self.current_base_output_dir and os.path.isdir(self.current_base_output_dir))
-        is_subfolder_specified = bool(self.subfolder_edit.text().strip())
+        is_output_dir_valid = self._output_dir_valid
+        is_subfolder_specified = self._subfolder_nonempty
 
-        player_ready = self.music_player and self.music_player.is_ready()
-        player_state = self.music_player.get_state() if player_ready else vlc.State.Error
-        is_playing_or_paused = player_state in [vlc.State.Playing, vlc.State.Paused]
+        player_ready = self._player_ready
+        player_state = self._vlc_state if player_ready else vlc.State.Error
+        is_playing_or_paused = player_state in _PLAYING_STATES
         is_actually_playing_orig = is_playing_or_paused and not self.is_preview_playing
 
         # --- Set Enabled States ---
 
         # Play Original Button
-        self.play_button.setEnabled(player_ready and is_selection_valid and not self.is_preview_playing)
-        self.play_button.setToolTip("Riproduci il file MP3 originale selezionato (Spazio)" if is_selection_valid else "Seleziona un brano per riprodurlo")
+        _set_enabled(self.play_button, player_ready and is_selection_valid and not self.is_preview_playing)
+        self._set_tooltip_by_key(self.play_button, self._PLAY_TOOLTIPS, "ok" if is_selection_valid else "no_sel")
 
         # Preview Button
         can_start_preview = player_ready and is_selection_valid and can_normalize and not is_actually_playing_orig
         # Button should be enabled if we CAN start a preview OR if a preview IS currently playing (to allow stopping it)
-        self.preview_button.setEnabled(can_start_preview or self.is_preview_playing)
+        _set_enabled(self.preview_button, can_start_preview or self.is_preview_playing)
         # Update tooltip based on why it's enabled/disabled
-        preview_tooltip = "Genera e ascolta un'anteprima normalizzata (Ctrl+P)"
-        if not can_normalize: preview_tooltip += "\n(Disabilitato: Librerie audio mancanti)"
-        elif not is_selection_valid: preview_tooltip += "\n(Disabilitato: Seleziona un brano)"
-        elif is_actually_playing_orig: preview_tooltip += "\n(Disabilitato durante riproduzione originale)"
-        elif self.is_preview_playing: preview_tooltip = "Ferma l'anteprima in corso (Ctrl+P)"
-        self.preview_button.setToolTip(preview_tooltip)
+        if not can_normalize: preview_key = "no_lib"
+        elif not is_selection_valid: preview_key = "no_sel"
+        elif is_actually_playing_orig: preview_key = "busy_orig"
+        elif self.is_preview_playing: preview_key = "playing"
+        else: preview_key = "ok"
+        self._set_tooltip_by_key(self.preview_button, self._PREVIEW_TOOLTIPS, preview_key)
         # Ensure check state matches internal state
-        self.preview_button.blockSignals(True); self.preview_button.setChecked(self.is_preview_playing); self.preview_button.blockSignals(False)
+        self._set_preview_button_silently(self.is_preview_playing)
 
 
         # Pause/Stop Buttons
-        self.pause_button.setEnabled(player_ready and is_playing_or_paused)
-        self.stop_button.setEnabled(player_ready and is_playing_or_paused)
+        _set_enabled(self.pause_button, player_ready and is_playing_or_paused)
+        _set_enabled(self.stop_button, player_ready and is_playing_or_paused)
 
         # Move Button
         can_move = is_selection_valid and is_output_dir_valid and is_subfolder_specified and can_normalize and not self.is_preview_playing
-        self.move_to_subfolder_button.setEnabled(can_move)
+        _set_enabled(self.move_to_subfolder_button, can_move)
         # Update move button tooltip
-        move_tooltip = "Normalizza, salva WAV in sottocartella, elimina MP3 originale."
-        if not can_normalize: move_tooltip = "Spostamento disabilitato: Librerie normalizzazione mancanti o errore init."
-        elif not is_selection_valid: move_tooltip = "Spostamento disabilitato: Seleziona un file."
-        elif not is_output_dir_valid: move_tooltip = "Spostamento disabilitato: Seleziona una Cartella Base Output valida."
-        elif not is_subfolder_specified: move_tooltip = "Spostamento disabilitato: Specifica una Sottocartella di destinazione."
-        elif self.is_preview_playing: move_tooltip = "Spostamento disabilitato durante l'anteprima."
-        self.move_to_subfolder_button.setToolTip(move_tooltip)
+        if not can_normalize: move_key = "no_lib"
+        elif not is_selection_valid: move_key = "no_sel"
+        elif not is_output_dir_valid: move_key = "no_output"
+        elif not is_subfolder_specified: move_key = "no_subfolder"
+        elif self.is_preview_playing: move_key = "preview"
+        else: move_key = "ok"
+        self._set_tooltip_by_key(self.move_to_subfolder_button, self._MOVE_TOOLTIPS, move_key)
 
 
         # Other Controls
-        self.recent_folder_combo.setEnabled(is_output_dir_valid and len(self.recent_folders) > 0)
-        self.subfolder_edit.setEnabled(is_output_dir_valid)
+        _set_enabled(self.recent_folder_combo, is_output_dir_valid and self._has_recents)
         # Only allow changing recursive scan if input dir is set and not busy
-        self.recursive_scan_checkbox.setEnabled(bool(self.current_input_dir))
-        self.clear_filter_button.setEnabled(bool(self.filter_edit.text()))
+        _set_enabled(self.recursive_scan_checkbox, self._input_dir_valid)
 
         # Volume slider should always be enabled if player is ready
-        self.volume_slider.setEnabled(player_ready)
+        _set_enabled(self.volume_slider, player_ready)
 
 
     # --- Settings Load/Save ---
@@ -2652,20 +3112,31 @@ class MainWindow(QMainWindow):
         """Carica le impostazioni dell'applicazione (percorsi, opzioni, audio)."""
         logging.info("Caricamento impostazioni...")
         try:
+            # Enumerate stored keys once: missing keys get their default without a backend lookup
+            stored_keys = set(self.settings.allKeys())
+            def stored_value(key, default, value_type):
+                return self.settings.value(key, default, type=value_type) if key in stored_keys else default
+
             # Paths (provide default empty strings)
-            saved_input = self.settings.value(SETTINGS_INPUT_PATH, "", type=str)
-            saved_output = self.settings.value(SETTINGS_OUTPUT_PATH, "", type=str)
+            saved_input = stored_value(SETTINGS_INPUT_PATH, "", str)
+            saved_output = stored_value(SETTINGS_OUTPUT_PATH, "", str)
 
             # Options
             # Provide explicit type hint for bool to avoid Qt interpreting 'false' string etc.
-            saved_recursive = self.settings.value(SETTINGS_RECURSIVE_SCAN, False, type=bool)
+            saved_recursive = stored_value(SETTINGS_RECURSIVE_SCAN, False, bool)
             # Provide default empty list and explicit type for list
-            saved_recents = self.settings.value(SETTINGS_RECENT_FOLDERS, [], type=list)
+            saved_recents = stored_value(SETTINGS_RECENT_FOLDERS, [], list)
 
             # Audio Settings
-            saved_volume = self.settings.value(SETTINGS_LAST_VOLUME, 70, type=int)
+            saved_volume = stored_value(SETTINGS_LAST_VOLUME, 70, int)
             # Use float for LUFS target, provide default
-            saved_target_lufs_str = self.settings.value(SETTINGS_TARGET_LUFS, str(TARGET_LUFS_DEFAULT), type=str)
+            saved_target_lufs_str = stored_value(SETTINGS_TARGET_LUFS, str(TARGET_LUFS_DEFAULT), str)
+
+            # Remember what is stored, so saving unchanged values is a no-op
+            for key, value in ((SETTINGS_RECURSIVE_SCAN, saved_recursive), (SETTINGS_RECENT_FOLDERS, list(saved_recents)),
+                               (SETTINGS_LAST_VOLUME, saved_volume), (SETTINGS_TARGET_LUFS, saved_target_lufs_str)):
+                if key in stored_keys:
+                    self._saved_setting_values[key] = value
 
 
             # --- Apply Settings ---
@@ -2676,38 +3147,40 @@ class MainWindow(QMainWindow):
                 self.current_input_dir = os.path.normpath(saved_input)
                 self.folder_input_edit.setText(self.current_input_dir)
                 valid_input_loaded = True
+                self._input_dir_valid = True
                 logging.info(f"Caricata cartella Input salvata: {self.current_input_dir}")
             elif saved_input: # If path was saved but is no longer valid
                  logging.warning(f"Cartella Input salvata '{saved_input}' non trovata o non valida. Sarà ignorata.")
                  self.folder_input_edit.clear()
                  self.current_input_dir = None
+                 self._input_dir_valid = False
                  self.settings.remove(SETTINGS_INPUT_PATH) # Remove invalid setting
 
             # Output Path: Validate similarly
             if saved_output and os.path.isdir(saved_output):
                 self.current_base_output_dir = os.path.normpath(saved_output)
+                self._set_output_dir_valid(True)
                 self.folder_output_edit.setText(self.current_base_output_dir)
                 logging.info(f"Caricata cartella Base Output salvata: {self.current_base_output_dir}")
             elif saved_output:
                  logging.warning(f"Cartella Base Output salvata '{saved_output}' non trovata o non valida. Sarà ignorata.")
                  self.folder_output_edit.clear()
                  self.current_base_output_dir = None
+                 self._set_output_dir_valid(False)
                  self.settings.remove(SETTINGS_OUTPUT_PATH)
 
             # Apply Options
             # Block signals briefly while setting initial state if it triggers actions
-            self.recursive_scan_checkbox.blockSignals(True)
-            self.recursive_scan_checkbox.setChecked(saved_recursive)
-            self.recursive_scan_checkbox.blockSignals(False)
+            with QSignalBlocker(self.recursive_scan_checkbox):
+                self.recursive_scan_checkbox.setChecked(saved_recursive)
 
             # Load recent folders (validate items are strings)
-            self.recent_folders = [f for f in saved_recents if isinstance(f, str) and f.strip()][:MAX_RECENT_FOLDERS]
-            self.recent_folder_combo.blockSignals(True)
-            self.recent_folder_combo.clear()
-            self.recent_folder_combo.addItem("--- Seleziona Recente ---")
-            self.recent_folder_combo.addItems(self.recent_folders)
-            self.recent_folder_combo.setCurrentIndex(0)
-            self.recent_folder_combo.blockSignals(False)
+            # islice stops at the cap: an oversized saved list is never filtered/copied in full
+            self.recent_folders = list(islice((f for f in saved_recents if isinstance(f, str) and f.strip()), MAX_RECENT_FOLDERS))
+            self._has_recents = bool(self.recent_folders)
+            with QSignalBlocker(self.recent_folder_combo): # Signals restored even if population raises
+                self._recent_model.setStringList([RECENT_FOLDERS_PLACEHOLDER, *self.recent_folders])
+                self.recent_folder_combo.setCurrentIndex(0)
 
 
             # Apply Audio Settings
@@ -2717,7 +3190,7 @@ class MainWindow(QMainWindow):
             # Set initial text for volume label
             self.volume_value_label.setText(f"{clamped_volume}%")
             # Apply volume to VLC player if ready
-            if self.music_player and self.music_player.is_ready():
+            if self._player_ready:
                 self.music_player.set_volume(clamped_volume)
 
             # Apply LUFS Target (validate format and range)
@@ -2745,7 +3218,7 @@ class MainWindow(QMainWindow):
             # Trigger initial file list load IF a valid input path was loaded
             if valid_input_loaded:
                 # Use QTimer to allow UI to fully initialize before starting scan
-                QTimer.singleShot(100, self._load_music_list)
+                QTimer.singleShot(100, Qt.CoarseTimer, self._load_music_list)
             else:
                  # If no valid input, just update UI state
                  self._update_button_states()
@@ -2765,29 +3238,29 @@ class MainWindow(QMainWindow):
         logging.info("Salvataggio impostazioni...")
         try:
             # Save Paths (only if they seem valid)
-            if self.current_input_dir and os.path.isdir(self.current_input_dir):
+            if self.current_input_dir and self._input_dir_valid: # Validated once when assigned (no isdir here)
                 self.settings.setValue(SETTINGS_INPUT_PATH, self.current_input_dir)
             else:
                  self.settings.remove(SETTINGS_INPUT_PATH) # Remove if invalid/not set
 
-            if self.current_base_output_dir and os.path.isdir(self.current_base_output_dir):
+            if self.current_base_output_dir and self._output_dir_valid:
                 self.settings.setValue(SETTINGS_OUTPUT_PATH, self.current_base_output_dir)
             else:
                 self.settings.remove(SETTINGS_OUTPUT_PATH)
 
             # Save Options
-            self.settings.setValue(SETTINGS_RECURSIVE_SCAN, self.recursive_scan_checkbox.isChecked())
+            # Unchanged values (vs last load/save) are skipped: no registry/ini write
+            self._set_setting_if_changed(SETTINGS_RECURSIVE_SCAN, self.recursive_scan_checkbox.isChecked())
             # Ensure recent folders list doesn't contain duplicates or invalid entries? (already filtered on add)
-            self.settings.setValue(SETTINGS_RECENT_FOLDERS, self.recent_folders)
+            self._set_setting_if_changed(SETTINGS_RECENT_FOLDERS, list(self.recent_folders))
 
             # Save Audio Settings
             current_volume = self.volume_slider.value()
-            self.settings.setValue(SETTINGS_LAST_VOLUME, current_volume)
+            self._set_setting_if_changed(SETTINGS_LAST_VOLUME, current_volume)
             # Save LUFS target as string for robustness
-            self.settings.setValue(SETTINGS_TARGET_LUFS, f"{self.target_lufs:.1f}")
+            self._set_setting_if_changed(SETTINGS_TARGET_LUFS, f"{self.target_lufs:.1f}")
 
-            # Force writing to disk (or registry on Windows)
-            self.settings.sync()
+            # No sync() here: QSettings flushes on its own; closeEvent syncs once at exit
             logging.info(f"Impostazioni salvate. Volume={current_volume}, Target LUFS={self.target_lufs:.1f}")
 
         except Exception as e:
@@ -2810,19 +3283,22 @@ class MainWindow(QMainWindow):
              if reply == QMessageBox.Yes:
                   logging.info("Interruzione worker richiesta da chiusura finestra.")
                   self.request_worker_stop()
-                  # Need to wait briefly? Or just proceed? Best to let it try to cancel.
-                  # Maybe disable closing for a moment? Hard to manage correctly.
-                  # Let's proceed with other cleanup for now. The thread should eventually finish.
-                  # event.ignore() # Prevent closing immediately?
-                  # return
+                  # The worker must be gone before VLC/temp files are released below.
+                  # No terminate(): killing a thread that runs Python code (possibly holding the GIL)
+                  # can deadlock the interpreter. Workers check isInterruptionRequested() between
+                  # steps, so they return once the current step (e.g. a LUFS measurement) is done.
+                  thread = self.active_worker_thread
+                  thread.quit() # Leave the thread's event loop once run() returns
+                  if not thread.wait(3000):
+                       logging.warning(f"Il thread {thread.objectName()} non si è fermato entro 3 s: attendo la fine del passo in corso...")
+                       thread.wait()
              else:
                   logging.info("Chiusura annullata dall'utente per operazione in corso.")
                   event.ignore() # Prevent the window from closing
                   return
 
-        # 2. Stop Playback Timers
-        logging.debug("Stop timer riproduzione e status bar...")
-        if self.progress_timer.isActive(): self.progress_timer.stop()
+        # 2. Stop UI Timers
+        logging.debug("Stop timer status bar...")
         if self.status_clear_timer.isActive(): self.status_clear_timer.stop()
 
         # 3. Stop Playback & Release Player Resources
@@ -2838,18 +3314,49 @@ class MainWindow(QMainWindow):
         if self.music_player:
             self.music_player.release() # This handles stopping and releasing VLC instance/player
             self.music_player = None
+        self._player_ready = False
 
         # 4. Final Cleanup of Temp File (just in case _stop_playback missed it)
         self._cleanup_preview_file()
+        # Let pending background deletions finish before the process exits
+        QThreadPool.globalInstance().waitForDone(2000)
 
-        # 5. Save Settings
+        # 5. Save Settings and flush to disk/registry once
         logging.debug("Salvataggio impostazioni...")
         self._save_settings()
+        self.settings.sync()
 
         logging.info(f"--- Chiusura {APP_NAME} ---")
         event.accept() # Allow the window to close
 
 
+def _qt_excepthook(etype, e, tb):
+    """Hook globale per eccezioni non gestite (avvio e slot Qt): log, dialog critico, uscita."""
+    if issubclass(etype, KeyboardInterrupt):
+        sys.__excepthook__(etype, e, tb)
+        return
+    logging.critical(f"Errore critico non gestito: {e}", exc_info=(etype, e, tb))
+    try: MainWindow._show_critical_error("Errore Applicazione", f"Si è verificato un errore critico:\n\n{e}\n\nL'applicazione sarà chiusa.")
+    except Exception: print(f"ERRORE CRITICO: {e}") # Fallback print
+    # Raising SystemExit inside a hook is ignored; end the event loop instead.
+    # Before exec_() (e.g. in MainWindow()) the interpreter exits with code 1 after the hook returns.
+    app = QApplication.instance()
+    if app: app.exit(1)
+
+
+def _startup_win_tweaks():
+    """Impostazioni di avvio solo Windows (AppUserModelID per icona/raggruppamento nella taskbar). Da chiamare una volta."""
+    if sys.platform != 'win32':
+        return
+    try:
+        import ctypes # Imported only on Windows, when actually needed
+        myappid = f'{ORG_NAME}.{APP_NAME}.{APP_NAME}.1.3' # Needs to be unique-ish string
+        ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
+        logging.info(f"AppUserModelID impostato (Win): {myappid}")
+    except Exception as e:
+        logging.warning(f"Impossibile impostare AppUserModelID (Win): {e}")
+
+
 # --- Punto Ingresso Applicazione ---
 if __name__ == "__main__":
     # --- Pre-GUI Checks & Setup ---
@@ -2861,19 +3368,15 @@ if __name__ == "__main__":
          sys.exit(1)
 
     # Setup App ID for Windows Taskbar Icon/Grouping (best effort)
-    if sys.platform == 'win32':
-        try:
-            import ctypes
-            myappid = f'{ORG_NAME}.{APP_NAME}.{APP_NAME}.1.3' # Needs to be unique-ish string
-            ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
-            logging.info(f"AppUserModelID impostato (Win): {myappid}")
-        except Exception as e:
-            logging.warning(f"Impossibile impostare AppUserModelID (Win): {e}")
+    _startup_win_tweaks()
 
     # Qt Application Setup
     # Enable High DPI support
     QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
     QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    # Qt 5.14+: keep fractional scale factors (e.g. 150%) instead of rounding then rescaling
+    if hasattr(QtGui.QGuiApplication, "setHighDpiScaleFactorRoundingPolicy") and hasattr(Qt, "HighDpiScaleFactorRoundingPolicy"):
+        QtGui.QGuiApplication.setHighDpiScaleFactorRoundingPolicy(Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
 
     # Set Org/App Name for QSettings
     QApplication.setOrganizationName(ORG_NAME)
@@ -2889,36 +3392,22 @@ if __name__ == "__main__":
 
     # Set Application Icon (optional, requires an icon file)
     icon_path = "app_icon.ico" # Example: place app_icon.ico near the script
-    if os.path.exists(icon_path):
-        app.setWindowIcon(QtGui.QIcon(icon_path))
+    app_icon = QtGui.QIcon(icon_path) # Null icon if the file is missing/unreadable (no separate exists() check)
+    if not app_icon.isNull():
+        app.setWindowIcon(app_icon)
         logging.info(f"Icona applicazione caricata da: {icon_path}")
     else:
          logging.debug(f"Icona applicazione ('{icon_path}') non trovata.")
 
     # --- Create and Show Main Window ---
-    window = None # Initialize variable
-    try:
-        window = MainWindow()
-        window.show()
-        logging.info("Finestra principale creata e mostrata.")
-    except SystemExit as exit_e:
-        # Handle sys.exit called during MainWindow init (e.g., VLC error)
-        logging.critical(f"Uscita durante l'inizializzazione di MainWindow: {exit_e}")
-        sys.exit(getattr(exit_e, 'code', 1)) # Use exit code if available, default to 1
-    except Exception as main_win_e:
-        logging.critical(f"Errore critico imprevisto durante la creazione di MainWindow: {main_win_e}", exc_info=True)
-        # Try to show graphical error message before exiting
-        try: MainWindow._show_critical_error("Errore Avvio Applicazione", f"Si è verificato un errore critico:\n\n{main_win_e}\n\nL'applicazione sarà chiusa.");
-        except: print(f"ERRORE CRITICO AVVIO: {main_win_e}") # Fallback print
-        sys.exit(1)
-
+    # Uncaught errors (here or later in any slot) go through the same critical dialog.
+    # sys.exit() during MainWindow init (e.g., VLC error) raises SystemExit, which bypasses the hook.
+    sys.excepthook = _qt_excepthook
+    window = MainWindow()
+    window.show()
+    logging.info("Finestra principale creata e mostrata.")
 
     # --- Run Event Loop ---
-    if window: # Only run app if window was successfully created
-         exit_code = app.exec_()
-         logging.info(f"Applicazione terminata con codice di uscita: {exit_code}")
-         sys.exit(exit_code)
-    else:
-         # Should not happen if exceptions are caught, but as a safeguard
-         logging.critical("MainWindow non è stata creata. Uscita.")
-         sys.exit(1)
+    exit_code = app.exec_()
+    logging.info(f"Applicazione terminata con codice di uscita: {exit_code}")
+    sys.exit(exit_code)
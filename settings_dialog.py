@@ -1,10 +1,35 @@
 from PyQt5 import QtWidgets
-from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel, QComboBox, QPushButton, QDialogButtonBox
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QPushButton, QDialogButtonBox
 from PyQt5.QtCore import pyqtSlot
+from typing import List, Optional
 import vlc
 import logging
 import pyaudio
 
+# Nomi dei dispositivi audio, enumerati una sola volta (PyAudio init + enumerazione sono lenti)
+_CACHED_DEVICES: Optional[List[str]] = None
+
+def _get_audio_devices(refresh: bool = False) -> List[str]:
+    """Restituisce i nomi dei dispositivi audio PyAudio (in cache; refresh=True forza una nuova enumerazione)."""
+    global _CACHED_DEVICES
+    if _CACHED_DEVICES is not None and not refresh:
+        return _CACHED_DEVICES
+    names = []
+    try:
+        audio = pyaudio.PyAudio()
+        for i in range(audio.get_device_count()):
+            try:
+                device_info = audio.get_device_info_by_index(i)
+                names.append(device_info['name'])
+            except OSError as e:
+                logging.error(f"Errore nel recupero dispositivo {i}: {e}")
+        audio.terminate()
+    except Exception as e:
+        logging.error(f"Errore nell'inizializzazione PyAudio: {e}")
+        return names # Don't cache a failed enumeration: retry on next open
+    _CACHED_DEVICES = names
+    return _CACHED_DEVICES
+
 class SettingsDialog(QDialog):
     def __init__(self, settings, parent=None):
         super().__init__(parent)
@@ -14,37 +39,47 @@ class SettingsDialog(QDialog):
 
         self.device_label = QLabel("Dispositivo Audio:")
         self.device_combo = QComboBox()
+        self._device_index = {} # Nome dispositivo -> indice nella combo (costruito in populate_device_combo)
         self.populate_device_combo()
+        self.refresh_button = QPushButton("Aggiorna")
+        self.refresh_button.setToolTip("Rileva di nuovo i dispositivi audio")
+        self.refresh_button.clicked.connect(self.refresh_devices)
 
         self.button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         self.button_box.accepted.connect(self.accept)
         self.button_box.rejected.connect(self.reject)
 
+        device_layout = QHBoxLayout()
+        device_layout.addWidget(self.device_combo, 1)
+        device_layout.addWidget(self.refresh_button)
+
         layout = QVBoxLayout()
         layout.addWidget(self.device_label)
-        layout.addWidget(self.device_combo)
+        layout.addLayout(device_layout)
         layout.addWidget(self.button_box)
         self.setLayout(layout)
 
         saved_device = self.settings.value("audio_device", "Predefinito")
-        index = self.device_combo.findText(saved_device)
+        index = self._device_index.get(saved_device, -1)
         if index >= 0:
             self.device_combo.setCurrentIndex(index)
 
-    def populate_device_combo(self):
-        """Popola la ComboBox con i dispositivi audio usando PyAudio"""
-        self.device_combo.addItem("Predefinito")
-        try:
-            audio = pyaudio.PyAudio()
-            for i in range(audio.get_device_count()):
-                try:
-                    device_info = audio.get_device_info_by_index(i)
-                    self.device_combo.addItem(device_info['name'])
-                except OSError as e:
-                    logging.error(f"Errore nel recupero dispositivo {i}: {e}")
-            audio.terminate()
-        except Exception as e:
-            logging.error(f"Errore nell'inizializzazione PyAudio: {e}")
+    def populate_device_combo(self, refresh: bool = False):
+        """Popola la ComboBox con i dispositivi audio (lista PyAudio in cache)"""
+        names = _get_audio_devices(refresh)
+        self.device_combo.clear()
+        self.device_combo.addItems(["Predefinito", *names]) # Single batched insertion
+        self._device_index = {}
+        for index, name in enumerate(["Predefinito", *names]):
+            # First occurrence wins, like findText
+            self._device_index.setdefault(name, index)
+
+    @pyqtSlot()
+    def refresh_devices(self):
+        """Invalida la cache e rienumera i dispositivi, mantenendo la selezione se ancora presente."""
+        current = self.device_combo.currentText()
+        self.populate_device_combo(refresh=True)
+        self.device_combo.setCurrentIndex(self._device_index.get(current, 0))
 
     def accept(self):
         selected_device = self.device_combo.currentText()